@@ -2,45 +2,108 @@
 Audio streaming utilities based on the `sounddevice` library.
 
 This module provides a small abstraction over sounddevice's InputStream,
-pushing raw audio frames into a thread-safe queue that the STT engine
+pushing raw audio frames into a bounded deque that the STT engine
 can consume.
 """
 
 from __future__ import annotations
 
-import queue
 import threading
+from collections import deque
 from typing import Optional, Callable
 
+import numpy as np
 import sounddevice as sd
 
-from ..config.settings import SAMPLE_RATE, CHANNELS, BLOCK_SIZE
+from ..config.settings import (
+    AUDIO_CHUNK_BYTES,
+    AUDIO_QUEUE_MAXLEN,
+    BLOCK_SIZE,
+    CHANNELS,
+    SAMPLE_RATE,
+    STT_MAX_BATCH_BYTES,
+)
+
+# Extra pool slots beyond the queue capacity and one consumer batch; see
+# the pool invariant in AudioStream.__init__.
+_POOL_SPARE_SLOTS = 4
 
 
 class AudioStream:
     """
-    Handle low-level audio capture and push frames into a queue.
+    Handle low-level audio capture and push frames into a deque.
 
     The core idea:
     - We create a `sounddevice.InputStream` with a callback.
-    - In the callback, we convert the NumPy audio buffer to bytes and
-      put it into a queue.
-    - The STT engine then pulls from that queue.
+    - In the callback, we copy the NumPy audio buffer into a pre-allocated
+      buffer from a small ring and append a `memoryview` of it to a deque
+      (single producer, single consumer). No heap allocation of a fresh
+      `bytes` object happens on the real-time audio thread.
+    - The STT engine then pops from the other end of that deque.
+
+    The ring holds a few more buffers than the deque can, so a slot is not
+    overwritten while it is still queued. Consumers must copy (or process)
+    a view before the producer wraps around to it again.
+
+    Every dequeued item is exactly `AUDIO_CHUNK_BYTES` long (the stream
+    uses a fixed `blocksize`), so a consumer aggregating `n` chunks can
+    pre-allocate `bytearray(n * AUDIO_CHUNK_BYTES)` and slice-assign
+    `buf[i * AUDIO_CHUNK_BYTES:(i + 1) * AUDIO_CHUNK_BYTES] = chunk`
+    instead of growing a list or concatenating `bytes`.
+
+    Alternatively, an `on_audio` sink can be given: each block is then passed
+    to it synchronously from the callback (as a memoryview over PortAudio's
+    buffer, valid only during the call) and nothing is queued.
     """
 
     def __init__(
         self,
-        audio_queue: "queue.Queue[bytes]",
-        on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        audio_queue: "deque[memoryview]",
+        on_error: Optional[Callable[[Exception], None]] = None,
+        audio_ready: Optional[threading.Event] = None,
+        on_audio: Optional[Callable[[memoryview], None]] = None) -> None:
         """
         Initialize an AudioStream.
 
-        :param audio_queue: Queue into which raw audio frames (bytes) are put.
+        :param audio_queue: Deque into which raw audio frames (memoryviews
+                            over pooled buffers) are appended. Should be
+                            bounded (`maxlen`) so the oldest frames are
+                            dropped if the consumer lags.
         :param on_error: Optional callback invoked if the internal stream
                          raises an exception.
+        :param audio_ready: Optional event set after each append, used to
+                            wake up the consumer without polling.
+        :param on_audio: Optional sink called with each block directly on
+                         the audio thread, bypassing audio_queue. It must
+                         finish well within one block period and must not
+                         keep the view after returning.
         """
         self._audio_queue = audio_queue
         self._on_error = on_error
+        self._audio_ready = audio_ready
+        self._on_audio = on_audio
+
+        # Ring of pre-allocated block buffers, stored as the rows of one
+        # contiguous uint8 array. Row arrays and their memoryviews are built
+        # once so the callback only indexes into lists.
+        #
+        # Invariant: a slot must not be rewritten while the consumer can
+        # still read it. The consumer holds at most one batch of popped
+        # blocks (a lone block is read by Vosk in place; larger batches are
+        # copied out first), so the ring covers every block the queue can
+        # hold, plus one batch, plus a few spare slots as headroom for
+        # callbacks that run while the consumer is between popleft() and
+        # finishing with a block.
+        max_batch = max(1, STT_MAX_BATCH_BYTES // AUDIO_CHUNK_BYTES)
+        pool_size = (
+            (audio_queue.maxlen or AUDIO_QUEUE_MAXLEN)
+            + max_batch
+            + _POOL_SPARE_SLOTS
+        )
+        self._pool = np.empty((pool_size, AUDIO_CHUNK_BYTES), dtype=np.uint8)
+        self._pool_rows = list(self._pool)
+        self._pool_views = [memoryview(row) for row in self._pool_rows]
+        self._pool_index = 0
 
         self._stream: Optional[sd.InputStream] = None
         self._lock = threading.Lock()
@@ -60,12 +123,32 @@ class AudioStream:
             # Here we simply print; in a real app you might use logging.
             print(f"Audio stream status: {status}")
 
-        # Convert the audio buffer to raw bytes.
+        # Direct mode: hand the block to the sink while `indata` is valid.
+        if self._on_audio is not None:
+            try:
+                self._on_audio(memoryview(indata.view(np.uint8).reshape(-1)))
+            except Exception as exc:  # noqa: BLE001
+                if self._on_error is not None:
+                    self._on_error(exc)
+            return
+
+        # Copy the audio buffer into the next pooled slot (in place).
         try:
-            data_bytes = indata.tobytes()
-            # Non-blocking put to avoid blocking the callback; if the queue
-            # is full, we drop the frame (simple back-pressure).
-            self._audio_queue.put_nowait(data_bytes)
+            slot = self._pool_index
+            self._pool_index = (slot + 1) % len(self._pool_views)
+
+            # `indata` is owned by PortAudio and reused for the next block,
+            # so one copy is required: reinterpret the int16 samples as raw
+            # bytes and copy them straight into the slot. With a fixed
+            # `blocksize`, sounddevice always delivers exactly BLOCK_SIZE
+            # frames, i.e. AUDIO_CHUNK_BYTES bytes.
+            np.copyto(self._pool_rows[slot], indata.view(np.uint8).reshape(-1))
+
+            # deque.append is atomic and lock-free; if the deque is full, the
+            # oldest frame is dropped automatically (simple back-pressure).
+            self._audio_queue.append(self._pool_views[slot])
+            if self._audio_ready is not None:
+                self._audio_ready.set()
         except Exception as exc:  # noqa: BLE001
             # If anything goes wrong in callback, we forward to the error
             # handler if provided.
@@ -76,26 +159,29 @@ class AudioStream:
         """
         Start the audio input stream.
 
-        Creates and starts a `sounddevice.InputStream` if not already running.
+        The `sounddevice.InputStream` is created (which opens the audio
+        device) only on the first call; later calls just restart it, which
+        avoids re-opening the device on every Start.
         """
         with self._lock:
             if self._is_running:
                 return
 
-            # Create the InputStream with our callback.
-            self._stream = sd.InputStream(
-                samplerate=SAMPLE_RATE,
-                channels=CHANNELS,
-                blocksize=BLOCK_SIZE,
-                dtype="int16",
-                callback=self._callback,
-            )
+            if self._stream is None:
+                # Create the InputStream with our callback.
+                self._stream = sd.InputStream(
+                    samplerate=SAMPLE_RATE,
+                    channels=CHANNELS,
+                    blocksize=BLOCK_SIZE,
+                    dtype="int16",
+                    callback=self._callback,
+                )
             self._stream.start()
             self._is_running = True
 
     def stop(self) -> None:
         """
-        Stop the audio input stream and release resources.
+        Stop capturing audio, keeping the device open for a fast restart.
         """
         with self._lock:
             if not self._is_running:
@@ -103,6 +189,17 @@ class AudioStream:
 
             if self._stream is not None:
                 self._stream.stop()
+
+            self._is_running = False
+
+    def close(self) -> None:
+        """
+        Stop capturing (if needed) and release the audio device.
+        """
+        with self._lock:
+            if self._stream is not None:
+                if self._is_running:
+                    self._stream.stop()
                 self._stream.close()
                 self._stream = None
 
@@ -2,55 +2,140 @@
 Central configuration values for the application.
 
 This keeps magic numbers and paths in a single place, making them
-easy to adjust or override later.
+easy to adjust or override later. Values are annotated as `Final` so
+type checkers flag accidental rebinding from other modules.
 """
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Final, Optional
+
+# Paths are resolved exactly once, at import time; every module shares these
+# immutable Path objects instead of re-running realpath().
 
 # Base directory of the project (three levels up from this file).
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+BASE_DIR: Final[Path] = Path(__file__).resolve().parents[2]
 
-# Root directory where all Vosk models live
-DEFAULT_MODELS_DIR = BASE_DIR / "models"
+# Root directory where all Vosk models live. Resolved so that scanning it
+# never has to walk through a symlinked "models" directory.
+DEFAULT_MODELS_DIR: Final[Path] = (BASE_DIR / "models").resolve()
 
 # Default Vosk model path (will be overridden by user selection)
-DEFAULT_VOSK_MODEL_PATH = DEFAULT_MODELS_DIR / "vosk-model-en-us-0.22"
+DEFAULT_VOSK_MODEL_PATH: Final[Path] = DEFAULT_MODELS_DIR / "vosk-model-en-us-0.22"
 
 # Audio settings.
-SAMPLE_RATE = 16000  # Vosk typically expects 16kHz audio.
-CHANNELS = 1         # Mono audio is sufficient for STT.
-BLOCK_SIZE = 8000    # Number of frames per block (tune for latency vs. CPU).
+SAMPLE_RATE: Final[int] = 16000  # Vosk typically expects 16kHz audio.
+CHANNELS: Final[int] = 1         # Mono audio is sufficient for STT.
+BLOCK_SIZE: Final[int] = 8000    # Number of frames per block (tune for latency vs. CPU).
+
+# Size in bytes of one int16 audio block. Every chunk produced by AudioStream
+# has exactly this size, so consumers can pre-allocate aggregate buffers.
+AUDIO_CHUNK_BYTES: Final[int] = BLOCK_SIZE * CHANNELS * 2
+
+# Maximum number of audio blocks buffered between the audio callback and the
+# STT engine. When full, the oldest block is dropped (64 blocks ~= 32 s).
+AUDIO_QUEUE_MAXLEN: Final[int] = 64
+
+# Upper bound on how much queued audio the STT engine hands to Vosk in one
+# AcceptWaveform call when it has fallen behind (whole blocks only, at least
+# one). Larger batches amortize the per-call overhead.
+STT_MAX_BATCH_BYTES: Final[int] = 32 * 1024
+
+# CPU core to pin the STT worker thread to, so Vosk's working set stays in
+# that core's caches. None (the default) leaves scheduling to the OS, which
+# is usually best on a desktop; e.g. -1 pins to the last usable core (negative
+# values count from the end), leaving core 0 to the GUI. Supported on Linux
+# and Windows, ignored elsewhere.
+STT_WORKER_CPU: Final[Optional[int]] = None
+
+# Feed audio blocks to the recognizer directly from the audio callback
+# instead of handing them to the engine thread through audio_queue. This
+# removes one queue hop and thread wakeup per block, but runs recognition on
+# the real-time audio thread: only enable it if decoding one block reliably
+# takes less than a block period, otherwise the device will overrun.
+STT_DIRECT_FEED: Final[bool] = False
+
+# Run the recognizer in a separate process (stt/vosk_process.py), with audio
+# passed through a shared-memory ring, so recognition never contends with
+# the GUI for the GIL. Costs an extra process and per-result IPC; when
+# enabled, STT_DIRECT_FEED is ignored.
+STT_ENGINE_IN_PROCESS: Final[bool] = False
+
+# Maximum number of STT results buffered for the GUI. If the Tk main loop
+# stalls, the oldest results are dropped instead of growing without bound.
+RESULT_QUEUE_MAXLEN: Final[int] = 256
 
 # Sentence segmentation settings.
 # Currently, Vosk final results already respect pauses, but this can be used
 # for additional logic (e.g., visual separation).
-SENTENCE_PAUSE_THRESHOLD_SEC = 1.0  # Seconds of silence to consider end of sentence.
+SENTENCE_PAUSE_THRESHOLD_SEC: Final[float] = 1.0  # Seconds of silence to consider end of sentence.
 
 # GUI timing.
-# How often (in milliseconds) the GUI checks for new STT results.
-GUI_POLL_INTERVAL_MS = 100
+# How often (in milliseconds) the GUI checks for new STT results. Derived
+# from the audio block period (a quarter of it, never below 10 ms) so live
+# partials appear within one block even when BLOCK_SIZE is lowered.
+GUI_POLL_INTERVAL_MS: Final[int] = max(10, int(1000 * BLOCK_SIZE / SAMPLE_RATE / 4))
+
+# Files whose presence identifies a directory as a Vosk model.
+VOSK_MODEL_MARKERS: Final[tuple[str, ...]] = (
+    os.path.join("am", "final.mdl"),
+    os.path.join("conf", "model.conf"),
+)
 
-def list_available_vosk_models(models_dir: Path | None = None) -> list[Path]:
+def list_available_vosk_models(
+    models_dir: Path | None = None, refresh: bool = False
+) -> list[Path]:
     """
     Return a list of subdirectories under models_dir that look like Vosk models.
+
+    Results are cached per directory and invalidated when the directory's
+    modification time changes (i.e., when entries are added, removed or
+    renamed). That does not catch changes inside an existing subdirectory
+    (e.g. a model finishing unpacking into it), so pass `refresh=True` for
+    user-requested rescans.
+
+    :param models_dir: Directory to scan (default: DEFAULT_MODELS_DIR).
+    :param refresh: Drop cached results and rescan the filesystem.
     """
     if models_dir is None:
         models_dir = DEFAULT_MODELS_DIR
 
-    if not models_dir.exists():
+    if refresh:
+        _scan_vosk_models.cache_clear()
+
+    try:
+        mtime_ns = models_dir.stat().st_mtime_ns
+    except OSError:
+        # Missing or unreadable directory -> no models.
         return []
 
+    # Return a fresh list so callers can't mutate the cached tuple.
+    return list(_scan_vosk_models(models_dir, mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _scan_vosk_models(models_dir: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """
+    Scan models_dir for model directories (see VOSK_MODEL_MARKERS).
+
+    `mtime_ns` is only part of the cache key. `os.scandir` yields file type
+    information from the directory listing itself, so no extra `stat` call
+    is needed to tell directories from files.
+    """
     candidates = []
-    for entry in models_dir.iterdir():
-        if entry.is_dir():
-            # Very simple heuristic: any non-empty dir is considered a model.
-            # You can make this stricter by checking for 'model', 'am', 'graph', etc.
-            try:
-                next(entry.iterdir())
-                candidates.append(entry)
-            except StopIteration:
-                # empty dir -> skip
-                pass
-    return candidates
+    with os.scandir(models_dir) as entries:
+        for entry in entries:
+            # Symlinks are followed on purpose: linking a model stored
+            # elsewhere into the models directory is a common setup. Only
+            # symlinked entries pay for the extra stat.
+            if not entry.is_dir():
+                continue
+            # A directory is a model if it contains one of the files every
+            # Vosk model ships with; this costs a single stat per marker.
+            path = Path(entry.path)
+            if any((path / marker).is_file() for marker in VOSK_MODEL_MARKERS):
+                candidates.append(path)
+    return tuple(candidates)
@@ -16,55 +16,91 @@ High-level responsibilities:
 from __future__ import annotations
 
 import json
-import queue
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
-from stt_gui.config import settings
-from stt_gui.stt.vosk_engine import VoskEngine, STTResult
+try:
+    # Optional: orjson is a much faster (C/Rust) JSON encoder.
+    import orjson
+except ImportError:
+    orjson = None
 
-
-from ..audio.audio_stream import AudioStream
 from ..config.settings import (
+    AUDIO_QUEUE_MAXLEN,
     DEFAULT_VOSK_MODEL_PATH,
     GUI_POLL_INTERVAL_MS,
+    RESULT_QUEUE_MAXLEN,
+    STT_DIRECT_FEED,
+    STT_ENGINE_IN_PROCESS,
 )
-from ..stt.vosk_engine import STTResult, VoskEngine
 from .model_manager import ModelManager
 from .notes_panel import NotesPanel
 from .speaker_manager import SpeakerManager
 from .transcription_panel import TranscriptionPanel
 
+if TYPE_CHECKING:
+    # Audio capture (numpy/sounddevice) and Vosk are heavy to import, so at
+    # runtime they are only loaded on the first transcription start.
+    from ..audio.audio_stream import AudioStream
+    from ..stt.vosk_engine import STTResult, VoskEngine
+    from ..stt.vosk_process import VoskEngineProcess
+
 
 class SpeechToTextApp(tk.Frame):
     """
     Main application GUI frame that embeds all panels.
     """
-    def __init__(self, master=None, **kwargs) -> None:
+    def __init__(
+        self,
+        master=None,
+        poll_interval_ms: int = GUI_POLL_INTERVAL_MS,
+        **kwargs,
+    ) -> None:
         """
         Initialize the application frame.
 
         :param master: Parent Tk widget (typically the root window).
+        :param poll_interval_ms: How often (ms) to check for new STT results
+                                 when idle. Lower values reduce live-text
+                                 latency at the cost of more wake-ups.
         :param kwargs: Extra options forwarded to tk.Frame.
         """
         super().__init__(master, **kwargs)
 
+        self._poll_interval_ms = max(1, int(poll_interval_ms))
+
         # Model path selected by user (updated by ModelManager callback).
         self._model_path: Optional[Path] = DEFAULT_VOSK_MODEL_PATH
 
+        # Whether _model_path is known to exist (models picked from the
+        # ModelManager list were found by scanning the models directory).
+        self._model_path_validated = False
+
         # Audio and STT engine instances (created lazily on start).
         self._audio_stream: Optional[AudioStream] = None
-        self._vosk_engine: Optional[VoskEngine] = None
+        self._vosk_engine: Optional[VoskEngine | VoskEngineProcess] = None
 
-        # Queues for audio and results, shared with VoskEngine
-        self._audio_queue: "queue.Queue[bytes]" = queue.Queue()
-        self._result_queue: "queue.Queue[STTResult]" = queue.Queue()
+        # FIFOs for audio and results, shared with VoskEngine. Both are
+        # bounded: the oldest entry is dropped if the consumer falls behind.
+        self._audio_queue: "deque[memoryview]" = deque(maxlen=AUDIO_QUEUE_MAXLEN)
+        self._result_queue: "deque[STTResult]" = deque(maxlen=RESULT_QUEUE_MAXLEN)
+
+        # Signalled by AudioStream whenever a new block is available.
+        self._audio_ready = threading.Event()
+
+        # Single worker thread that serializes start/stop operations, so
+        # rapid clicks can never race two initializations.
+        self._ctl_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="stt-control"
+        )
 
         # Engine starts as None, only created after a model is selected
         self._engine: Optional[VoskEngine] = None
@@ -79,8 +115,13 @@ class SpeechToTextApp(tk.Frame):
         # Build all GUI components.
         self._build_ui()
 
-        # Schedule periodic polling of STT results.
-        self.after(GUI_POLL_INTERVAL_MS, self._poll_stt_results)
+        # Schedule periodic polling of STT results: a repeating timer tick
+        # that queues an idle-time drain (see _on_poll_tick). Both ids are
+        # kept so destroy() can cancel them.
+        self._poll_idle_id: Optional[str] = None
+        self._poll_timer: Optional[str] = self.after(
+            self._poll_interval_ms, self._on_poll_tick
+        )
 
     # ------------------------------------------------------------------
     # UI construction
@@ -121,7 +162,9 @@ class SpeechToTextApp(tk.Frame):
 
         # Middle: transcription panel.
         self.transcription_panel = TranscriptionPanel(
-            left_frame, on_note_created=self._on_note_created
+            left_frame,
+            on_note_created=self._on_note_created,
+            speaker_color_lookup=self.speaker_manager.get_speaker_color,
         )
         self.transcription_panel.pack(fill="both", expand=True, padx=4, pady=4)
 
@@ -142,15 +185,17 @@ class SpeechToTextApp(tk.Frame):
         :param model_path: Path to the selected model directory.
         """
         self._model_path = model_path
+        self._model_path_validated = True
 
-    def _on_active_speaker_changed(self, name: str, color: str) -> None:
+    def _on_active_speaker_changed(self, name: str, color: str, tag_name: str) -> None:
         """
         Callback from SpeakerManager when active speaker changes.
 
         :param name: New active speaker name.
         :param color: New active speaker color.
+        :param tag_name: Precomputed transcript tag name for this speaker.
         """
-        self.transcription_panel.update_active_speaker(name, color)
+        self.transcription_panel.update_active_speaker(name, color, tag_name)
 
     def _on_note_created(
         self,
@@ -223,8 +268,11 @@ class SpeechToTextApp(tk.Frame):
             first = speakers[0]
             self.speaker_manager.set_active_speaker(first)
 
-        # Check that the Vosk model path exists.
-        if not self._model_path or not self._model_path.exists():
+        # Check that the Vosk model path exists (only hits the filesystem
+        # if it was not already validated at selection time).
+        if self._model_path and not self._model_path_validated:
+            self._model_path_validated = self._model_path.exists()
+        if not self._model_path or not self._model_path_validated:
             messagebox.showerror(
                 "Vosk Model Missing",
                 f"Vosk model not found at:\n{self._model_path}\n\n"
@@ -239,7 +287,10 @@ class SpeechToTextApp(tk.Frame):
             start_time=None,
             end_time=None,
         )
-        self.speaker_manager.start_stop_button.config(text="Starting...")
+        # Disable the button until the worker reports back.
+        self.speaker_manager.start_stop_button.config(
+            text="Starting...", state="disabled"
+        )
 
         def init_worker() -> None:
             """
@@ -250,16 +301,46 @@ class SpeechToTextApp(tk.Frame):
             - Record the wall-clock start time for timestamps.
             """
             try:
-                # Create audio stream if not done yet.
-                if self._audio_stream is None:
-                    self._audio_stream = AudioStream(self._audio_queue)
+                # Deferred imports: loaded on the first start only, off the
+                # GUI thread, so they do not delay the window appearing.
+                from ..audio.audio_stream import AudioStream
+                from ..stt.vosk_engine import VoskEngine
+
+                # Direct feed needs the engine in this process.
+                direct_feed = STT_DIRECT_FEED and not STT_ENGINE_IN_PROCESS
 
-                # Create Vosk engine if not done yet.
+                # Create Vosk engine if not done yet. In direct-feed mode it
+                # gets no audio queue and is driven by the audio callback.
                 if self._vosk_engine is None:
-                    self._vosk_engine = VoskEngine(
-                        model_path=self._model_path,
-                        audio_queue=self._audio_queue,
-                        result_queue=self._result_queue,
+                    if STT_ENGINE_IN_PROCESS:
+                        from ..stt.vosk_process import VoskEngineProcess
+
+                        self._vosk_engine = VoskEngineProcess(
+                            model_path=self._model_path,
+                            audio_queue=self._audio_queue,
+                            result_queue=self._result_queue,
+                            audio_ready=self._audio_ready,
+                            on_error=self._on_engine_error,
+                        )
+                    else:
+                        self._vosk_engine = VoskEngine(
+                            model_path=self._model_path,
+                            audio_queue=(
+                                None if direct_feed else self._audio_queue
+                            ),
+                            result_queue=self._result_queue,
+                            audio_ready=self._audio_ready,
+                            on_error=self._on_engine_error,
+                        )
+
+                # Create audio stream if not done yet.
+                if self._audio_stream is None:
+                    self._audio_stream = AudioStream(
+                        self._audio_queue,
+                        audio_ready=self._audio_ready,
+                        on_audio=(
+                            self._vosk_engine.feed if direct_feed else None
+                        ),
                     )
 
                 # Record the wall-clock time at which the stream starts.
@@ -278,7 +359,9 @@ class SpeechToTextApp(tk.Frame):
                         start_time=None,
                         end_time=None,
                     )
-                    self.speaker_manager.start_stop_button.config(text="Stop")
+                    self.speaker_manager.start_stop_button.config(
+                        text="Stop", state="normal"
+                    )
 
                 self.after(0, on_ready)
 
@@ -293,19 +376,53 @@ class SpeechToTextApp(tk.Frame):
                         start_time=None,
                         end_time=None,
                     )
-                    self.speaker_manager.start_stop_button.config(text="Start")
+                    self.speaker_manager.start_stop_button.config(
+                        text="Start", state="normal"
+                    )
                     messagebox.showerror(
                         "Error starting transcription", str(exc), parent=self
                     )
 
                 self.after(0, on_error)
 
-        # Launch initialization in a background thread.
-        threading.Thread(target=init_worker, daemon=True).start()
+        # Launch initialization on the control worker thread.
+        self._ctl_executor.submit(init_worker)
+
+    def _on_engine_error(self, exc: Exception) -> None:
+        """
+        Report non-fatal errors from the STT engine (called off the GUI thread).
+
+        :param exc: Exception describing the problem (e.g., dropped results).
+        """
+        # Here we simply print; in a real app you might use logging.
+        print(f"STT engine: {exc}")
 
     def _stop_transcription(self) -> None:
         """
-        Stop audio capture and STT processing.
+        Stop audio capture and STT processing, asynchronously.
+        """
+        self.speaker_manager.start_stop_button.config(
+            text="Stopping...", state="disabled"
+        )
+
+        def stop_worker() -> None:
+            """
+            Background shutdown (joining the engine thread may take a moment).
+            """
+            self._stop_engines()
+
+            def on_stopped() -> None:
+                self.speaker_manager.start_stop_button.config(
+                    text="Start", state="normal"
+                )
+
+            self.after(0, on_stopped)
+
+        self._ctl_executor.submit(stop_worker)
+
+    def _stop_engines(self) -> None:
+        """
+        Stop the audio stream and Vosk engine (blocking, thread-agnostic).
         """
         if self._audio_stream is not None:
             self._audio_stream.stop()
@@ -314,7 +431,6 @@ class SpeechToTextApp(tk.Frame):
 
         self._is_running = False
         self._stream_start_wall_time = None
-        self.speaker_manager.start_stop_button.config(text="Start")
 
     # ------------------------------------------------------------------
     # Export to JSON
@@ -323,13 +439,11 @@ class SpeechToTextApp(tk.Frame):
         """
         Handle Export button click.
 
-        Gathers speakers, transcription lines, and notes, then exports
-        them to a JSON file selected by the user.
+        Asks the user for a destination file, then gathers speakers,
+        transcription lines, and notes and exports them to it as JSON.
         """
-        # Build the data structure.
-        data = self._build_export_data()
-
-        # Ask the user for a destination file.
+        # Ask the user for a destination file first, so nothing is built
+        # if the dialog is cancelled.
         file_path = filedialog.asksaveasfilename(
             parent=self,
             title="Export transcription and notes",
@@ -339,10 +453,12 @@ class SpeechToTextApp(tk.Frame):
         if not file_path:
             return
 
+        # Build the data structure.
+        data = self._build_export_data()
+
         # Write JSON file.
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json(file_path, data)
 
             messagebox.showinfo(
                 "Export successful",
@@ -356,6 +472,24 @@ class SpeechToTextApp(tk.Frame):
                 parent=self,
             )
 
+    def _write_json(self, file_path: str, data: dict) -> None:
+        """
+        Write `data` to `file_path` as indented UTF-8 JSON.
+
+        Uses orjson when installed; otherwise json.dump, which streams
+        encoded chunks straight to the file instead of building one string.
+
+        :param file_path: Destination file.
+        :param data: JSON-serializable object.
+        """
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
     def _build_export_data(self) -> dict:
         """
         Build a JSON-serializable object representing the session.
@@ -383,8 +517,15 @@ class SpeechToTextApp(tk.Frame):
         # Notes: from NotesPanel.
         notes = self.notes_panel.get_notes()
 
+        # Capture a single integer timestamp; the human-readable form is
+        # derived from it (bulk per-segment times can later be converted
+        # the same way, vectorized).
+        exported_at_ns = time.time_ns()
         metadata = {
-            "exported_at": datetime.now().isoformat(timespec="milliseconds"),
+            "exported_at": datetime.fromtimestamp(exported_at_ns / 1e9).isoformat(
+                timespec="milliseconds"
+            ),
+            "exported_at_ns": exported_at_ns,
         }
 
         return {
@@ -527,58 +668,93 @@ class SpeechToTextApp(tk.Frame):
     # ------------------------------------------------------------------
     # STT result polling
     # ------------------------------------------------------------------
-    def _poll_stt_results(self) -> None:
+    def _on_poll_tick(self) -> None:
         """
-        Periodically poll the STT result queue and update the GUI.
+        Periodic timer: re-arm itself and request an idle-time drain.
 
-        This method is scheduled using Tk's `after` mechanism so that
-        all GUI updates occur on the main thread.
+        The drain runs via `after_idle`, so Tk can coalesce it with other
+        pending work, and at most one drain is ever queued.
         """
-        try:
-            while True:
-                # Non-blocking get; break when queue is empty.
-                result = self._result_queue.get_nowait()
-                self._handle_stt_result(result)
-        except queue.Empty:
-            pass
+        self._poll_timer = self.after(self._poll_interval_ms, self._on_poll_tick)
+        if self._poll_idle_id is None:
+            self._poll_idle_id = self.after_idle(self._poll_stt_results)
 
-        # Re-schedule this method.
-        self.after(GUI_POLL_INTERVAL_MS, self._poll_stt_results)
-
-    def _handle_stt_result(self, result: STTResult) -> None:
+    def _poll_stt_results(self) -> None:
         """
-        Update the GUI based on a new STTResult.
+        Drain the STT result queue and update the GUI.
+
+        This method is scheduled using Tk's `after_idle` mechanism (from
+        `_on_poll_tick`) so that all GUI updates occur on the main thread.
+        """
+        self._poll_idle_id = None
+
+        # Drain everything produced since the last tick into locals first,
+        # so the widgets are touched once per tick rather than per result.
+        last_partial: Optional[STTResult] = None
+        finals: list[STTResult] = []
+        drained = False
+        while self._result_queue:
+            result = self._result_queue.popleft()
+            drained = True
+            if result.type == "partial":
+                # Only the most recent partial is ever visible.
+                if last_partial is not None:
+                    last_partial.release()
+                last_partial = result
+            elif result.type == "final":
+                finals.append(result)
+                # A final supersedes any partial received before it.
+                if last_partial is not None:
+                    last_partial.release()
+                last_partial = None
+            else:
+                result.release()
 
-        :param result: STTResult from the STT engine.
+        if drained:
+            self._apply_stt_results(finals, last_partial)
+
+            # The widgets only keep copies of the fields, so the results
+            # can go back to the engine's pool.
+            for result in finals:
+                result.release()
+            if last_partial is not None:
+                last_partial.release()
+
+        # While results are flowing, drain again as soon as Tk is idle (after
+        # the updates above are painted) so bursts are picked up quickly;
+        # otherwise wait for the next timer tick.
+        if drained:
+            self._poll_idle_id = self.after_idle(self._poll_stt_results)
+
+    def _apply_stt_results(
+        self,
+        finals: list[STTResult],
+        last_partial: Optional[STTResult],
+    ) -> None:
         """
-        # Real-world times are computed based on the stream start time
-        # and the relative times provided by Vosk.
-        real_start: Optional[float] = None
-        real_end: Optional[float] = None
+        Update the GUI with one poll tick's worth of STT results.
 
-        if (
-            self._stream_start_wall_time is not None
-            and result.start_time is not None
-            and result.end_time is not None
-        ):
-            real_start = self._stream_start_wall_time + result.start_time
-            real_end = self._stream_start_wall_time + result.end_time
+        :param finals: Final results, in arrival order.
+        :param last_partial: Latest partial received after the last final
+                             (or None).
+        """
+        if finals:
+            # Final results: insert new sentences with real-world times.
+            self.transcription_panel.add_final_sentences(
+                [
+                    (result.text, *self._to_real_times(result))
+                    for result in finals
+                ]
+            )
 
-        if result.type == "partial":
+        if last_partial is not None:
             # Partial results: show text in the live area (without timestamp).
             self.transcription_panel.update_live_partial(
-                text=result.text,
+                text=last_partial.text,
                 start_time=None,
                 end_time=None,
             )
-        elif result.type == "final":
-            # Final result: insert a new sentence with real-world times.
-            self.transcription_panel.add_final_sentence(
-                text=result.text,
-                start_time=real_start,
-                end_time=real_end,
-            )
-
+        elif finals:
             # Clear the live label when a final segment is added.
             self.transcription_panel.update_live_partial(
                 text="",
@@ -586,6 +762,29 @@ class SpeechToTextApp(tk.Frame):
                 end_time=None,
             )
 
+    def _to_real_times(
+        self, result: STTResult
+    ) -> tuple[Optional[float], Optional[float]]:
+        """
+        Convert an STTResult's Vosk-relative times to wall-clock times.
+
+        :param result: STTResult from the STT engine.
+        :return: (real_start, real_end) as UNIX timestamps, or (None, None).
+        """
+        # Real-world times are computed based on the stream start time
+        # and the relative times provided by Vosk.
+        if (
+            self._stream_start_wall_time is None
+            or result.start_time is None
+            or result.end_time is None
+        ):
+            return None, None
+
+        return (
+            self._stream_start_wall_time + result.start_time,
+            self._stream_start_wall_time + result.end_time,
+        )
+
     # ------------------------------------------------------------------
     # Widget teardown
     # ------------------------------------------------------------------
@@ -595,5 +794,22 @@ class SpeechToTextApp(tk.Frame):
 
         This is called when the Tk window is closed.
         """
-        self._stop_transcription()
+        # Cancel pending polls so they never fire on a half-destroyed widget.
+        if self._poll_timer is not None:
+            self.after_cancel(self._poll_timer)
+            self._poll_timer = None
+        if self._poll_idle_id is not None:
+            self.after_cancel(self._poll_idle_id)
+            self._poll_idle_id = None
+
+        # Drop queued start/stop requests and stop synchronously: the widget
+        # is going away, so there is no GUI left to call back into. We do
+        # not wait for a running worker, since its `after` calls need the
+        # main thread we are blocking.
+        self._ctl_executor.shutdown(wait=False, cancel_futures=True)
+        self._stop_engines()
+        if self._audio_stream is not None:
+            self._audio_stream.close()
+        if self._vosk_engine is not None:
+            self._vosk_engine.close()
         super().destroy()
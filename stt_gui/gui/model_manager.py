@@ -9,6 +9,7 @@ Responsible for:
 
 from __future__ import annotations
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Callable, Optional
@@ -42,15 +43,16 @@ class ModelManager(tk.Frame):
         self._on_model_selected = on_model_selected
         self._current_model: Optional[Path] = None
 
-        # Get available models
-        self._available_models = list_available_vosk_models(DEFAULT_MODELS_DIR)
+        # Available models are discovered in the background (see below).
+        self._available_models: list[Path] = []
 
         # Build UI controls.
         self._build_ui()
 
-        # Select the first model by default
-        if self._available_models:
-            self._select_model(self._available_models[0])
+        # Scan the models directory off the GUI thread: on slow or network
+        # filesystems this would otherwise block startup. The first model
+        # is selected by default once the scan completes.
+        self._start_scan(on_done=self._on_initial_scan_done)
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -89,13 +91,10 @@ class ModelManager(tk.Frame):
         # Dropdown (combobox) for model selection
         self.model_var = tk.StringVar()
         
-        # Create list of display names
-        model_names = [self.get_model_display_name(m) for m in self._available_models]
-
         self.model_combo = ttk.Combobox(
             controls_frame,
             textvariable=self.model_var,
-            values=model_names,
+            values=[],
             state="readonly",
             width=40,
         )
@@ -103,12 +102,12 @@ class ModelManager(tk.Frame):
         self.model_combo.bind("<<ComboboxSelected>>", self._on_model_combo_selected)
 
         # Refresh button
-        refresh_button = tk.Button(
+        self.refresh_button = tk.Button(
             controls_frame,
             text="Refresh Models",
             command=self._on_refresh_clicked,
         )
-        refresh_button.pack(side="left", padx=2)
+        self.refresh_button.pack(side="left", padx=2)
 
     # ------------------------------------------------------------------
     # Button handlers
@@ -127,10 +126,73 @@ class ModelManager(tk.Frame):
 
     def _on_refresh_clicked(self) -> None:
         """
-        Refresh the list of available models.
+        Refresh the list of available models (in the background).
+        """
+        self._start_scan(on_done=self._on_refresh_scan_done, refresh=True)
+
+    # ------------------------------------------------------------------
+    # Background model discovery
+    # ------------------------------------------------------------------
+    def _start_scan(
+        self, on_done: Callable[[], None], refresh: bool = False
+    ) -> None:
+        """
+        Scan the models directory on a worker thread.
+
+        :param on_done: Called on the GUI thread once the model list has
+                        been applied.
+        :param refresh: Bypass the cached scan results.
+        """
+        self.refresh_button.config(state="disabled")
+        self.model_var.set("Scanning models…")
+
+        def scan_worker() -> None:
+            try:
+                models = list_available_vosk_models(
+                    DEFAULT_MODELS_DIR, refresh=refresh
+                )
+            except OSError:
+                models = []
+
+            # Switch back to the main thread to update the GUI.
+            self.after(0, lambda: self._apply_model_list(models, on_done))
+
+        threading.Thread(target=scan_worker, daemon=True).start()
+
+    def _apply_model_list(
+        self, models: list[Path], on_done: Callable[[], None]
+    ) -> None:
+        """
+        Apply a freshly scanned model list to the combobox.
+
+        :param models: Model directories found by the scan.
+        :param on_done: Follow-up action for the caller of `_start_scan`.
+        """
+        self._available_models = models
+        self.refresh_button.config(state="normal")
+
+        # Update the combobox values
+        model_names = [self.get_model_display_name(m) for m in models]
+        self.model_combo["values"] = model_names
+
+        if self._current_model is not None:
+            self.model_var.set(self.get_model_display_name(self._current_model))
+        else:
+            self.model_var.set("")
+
+        on_done()
+
+    def _on_initial_scan_done(self) -> None:
+        """
+        Select the first model by default after the startup scan.
         """
-        self._available_models = list_available_vosk_models(DEFAULT_MODELS_DIR)
+        if self._available_models:
+            self._select_model(self._available_models[0])
 
+    def _on_refresh_scan_done(self) -> None:
+        """
+        Report the outcome of a user-requested refresh.
+        """
         if not self._available_models:
             messagebox.showwarning(
                 "No Models Found",
@@ -139,10 +201,6 @@ class ModelManager(tk.Frame):
             )
             return
 
-        # Update the combobox values
-        model_names = [self.get_model_display_name(m) for m in self._available_models]
-        self.model_combo["values"] = model_names
-
         # Select the first model
         self._select_model(self._available_models[0])
         messagebox.showinfo(
@@ -158,16 +216,11 @@ class ModelManager(tk.Frame):
         """
         Select a model and notify the callback.
 
+        Paths come from `list_available_vosk_models`, which has just listed
+        them, so no extra existence check is made here.
+
         :param model_path: Path to the model directory.
         """
-        if not model_path.exists():
-            messagebox.showerror(
-                "Model Not Found",
-                f"Model directory does not exist:\n{model_path}",
-                parent=self,
-            )
-            return
-
         self._current_model = model_path
         display_name = self.get_model_display_name(model_path)
         self.model_var.set(display_name)
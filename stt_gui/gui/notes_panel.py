@@ -14,6 +14,12 @@ import tkinter as tk
 from tkinter import scrolledtext
 from typing import Optional, List, Dict
 
+# Compiled once at import: note header "[timestamp] SpeakerName:" and the
+# blank-line separator between note blocks. The timestamp group uses a
+# negated class ([^\]]*) rather than a lazy ".*?", so it never backtracks.
+_HEADER_RE = re.compile(r"\[([^\]]*)\]\s+([^:]+):\s*")
+_BLOCK_SPLIT_RE = re.compile(r"\n\s*\n")
+
 
 class NotesPanel(tk.Frame):
     """
@@ -33,6 +39,15 @@ class NotesPanel(tk.Frame):
         self._text = scrolledtext.ScrolledText(self, wrap="word", width=40)
         self._text.pack(fill="both", expand=True)
 
+        # Speaker tags configured so far, tracked on the Python side so
+        # adding a note doesn't have to fetch every tag name from Tk.
+        self._configured_speaker_tags: set[str] = set()
+
+        # Structured copy of every note, valid while the user has not edited
+        # the text (tracked with Tk's "modified" flag); see get_notes.
+        self._records: List[Dict[str, str]] = []
+        self._records_stale = False
+
     def add_note(
         self,
         speaker_name: str,
@@ -51,29 +66,61 @@ class NotesPanel(tk.Frame):
         # Format the header line for this note.
         header = f"[{timestamp_str}] {speaker_name}: "
 
-        # Insert the header.
-        start_index = self._text.index("end-1c")
-        self._text.insert("end", header)
-        end_index = self._text.index("end-1c")
+        # Remember whether the user edited the text before this insert.
+        if not self._records_stale and self._text.edit_modified():
+            self._records_stale = True
 
         # Create or reuse a tag for this speaker to color the header.
         speaker_tag = f"note_speaker_{speaker_name}"
-        if speaker_tag not in self._text.tag_names():
+        if speaker_tag not in self._configured_speaker_tags:
             self._text.tag_configure(speaker_tag, foreground=speaker_color)
+            self._configured_speaker_tags.add(speaker_tag)
 
-        self._text.tag_add(speaker_tag, start_index, end_index)
-
-        # Insert the note body and a blank line for separation.
-        self._text.insert("end", text + "\n\n")
+        # Insert the tagged header, then the untagged note body and a blank
+        # line for separation, in a single (chars, tags) insert call.
+        self._text.insert(
+            "end", header, (speaker_tag,), text + "\n\n", ()
+        )
         self._text.see("end")
 
+        self._records.append(
+            {
+                "timestamp": timestamp_str,
+                "speaker": speaker_name,
+                "text": text.strip(),
+            }
+        )
+        if not self._records_stale:
+            # Our own insert is not a user edit.
+            self._text.edit_modified(False)
+
     def get_notes(self) -> List[Dict[str, str]]:
         """
         Extract all notes from the notes panel in a structured form.
 
         Notes are stored as blocks separated by blank lines, each block:
-          [timestamp] SpeakerName:
-          note text (possibly multi-line)
+          [timestamp] SpeakerName: note text
+          (possibly continued on further lines)
+
+        The text is only parsed if the user edited it since the last call;
+        otherwise the notes recorded by `add_note` are returned.
+
+        :return: List of dicts with keys: "timestamp", "speaker", "text".
+        """
+        if not self._records_stale and not self._text.edit_modified():
+            return list(self._records)
+
+        results = self._parse_notes()
+
+        # Re-sync so later calls can use the fast path again.
+        self._records = list(results)
+        self._records_stale = False
+        self._text.edit_modified(False)
+        return results
+
+    def _parse_notes(self) -> List[Dict[str, str]]:
+        """
+        Parse all notes from the current text of the panel.
 
         :return: List of dicts with keys: "timestamp", "speaker", "text".
         """
@@ -81,17 +128,40 @@ class NotesPanel(tk.Frame):
         if not content:
             return []
 
-        # Split by blank lines (one or more).
-        blocks = re.split(r"\n\s*\n", content)
+        # Fast path: add_note always separates notes with exactly "\n\n",
+        # so a plain str.split usually suffices. If a block doesn't look like
+        # a single well-formed note (e.g., after hand edits left spaces on a
+        # blank line), fall back to the whitespace-tolerant regex split.
+        results = self._parse_blocks(content.split("\n\n"), strict=True)
+        if results is None:
+            # Split by blank lines (one or more, possibly with whitespace).
+            results = self._parse_blocks(_BLOCK_SPLIT_RE.split(content), strict=False)
+        return results
 
+    def _parse_blocks(
+        self, blocks: List[str], strict: bool
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Parse note blocks of the form "[timestamp] SpeakerName: text...".
+
+        :param blocks: Candidate note blocks.
+        :param strict: If True, return None as soon as a block has an
+                       unparsable header or seems to contain another note
+                       header, instead of skipping or merging it.
+        :return: List of dicts with keys "timestamp", "speaker", "text", or
+                 None (strict mode only).
+        """
         results: List[Dict[str, str]] = []
-        header_pattern = re.compile(r"\[(.*?)\]\s+([^:]+):\s*")
 
         for block in blocks:
             block = block.strip()
             if not block:
                 continue
 
+            if strict and "\n[" in block:
+                # Possibly two notes separated by a whitespace-only line.
+                return None
+
             lines = block.splitlines()
             if not lines:
                 continue
@@ -99,14 +169,17 @@ class NotesPanel(tk.Frame):
             header = lines[0]
             body_lines = lines[1:]
 
-            match = header_pattern.match(header)
+            match = _HEADER_RE.match(header)
             if not match:
+                if strict:
+                    return None
                 # If we cannot parse the header, skip this block.
                 continue
 
             timestamp_str = match.group(1)
             speaker_name = match.group(2).strip()
-            note_text = "\n".join(body_lines).strip()
+            # The note text starts on the header line, right after "Name:".
+            note_text = "\n".join([header[match.end():]] + body_lines).strip()
 
             results.append(
                 {
@@ -11,11 +11,13 @@ Responsible for:
 
 from __future__ import annotations
 
-import itertools
+import sys
 import tkinter as tk
 from tkinter import colorchooser, simpledialog, messagebox
 from typing import Callable, Dict, Optional, List
 
+from .widgets import TimestampedText
+
 
 class SpeakerManager(tk.Frame):
     """
@@ -25,7 +27,7 @@ class SpeakerManager(tk.Frame):
     def __init__(
         self,
         master: Optional[tk.Misc] = None,
-        on_active_speaker_changed: Optional[Callable[[str, str], None]] = None,
+        on_active_speaker_changed: Optional[Callable[[str, str, str], None]] = None,
         on_export_clicked: Optional[Callable[[], None]] = None,
         **kwargs,
     ) -> None:
@@ -35,7 +37,8 @@ class SpeakerManager(tk.Frame):
         :param master: Parent widget.
         :param on_active_speaker_changed: Callback invoked when the user
                                           changes the active speaker.
-                                          Signature: (speaker_name, color).
+                                          Signature: (speaker_name, color,
+                                          tag_name).
         :param on_export_clicked: Callback invoked when the Export button
                                   is clicked (no arguments).
         :param kwargs: Extra options for tk.Frame.
@@ -45,23 +48,28 @@ class SpeakerManager(tk.Frame):
         self._on_active_speaker_changed = on_active_speaker_changed
         self._on_export_clicked = on_export_clicked
 
-        # Store speakers as a mapping from speaker name to (color, button).
-        self._speakers: Dict[str, Dict[str, object]] = {}
+        # Speaker data as parallel mappings keyed by speaker name (all in
+        # insertion order): name -> color, name -> button, and name -> the
+        # interned transcript text-tag name, built once per speaker.
+        self._speaker_colors: Dict[str, str] = {}
+        self._speaker_buttons: Dict[str, tk.Button] = {}
+        self._speaker_tags: Dict[str, str] = {}
         self._active_speaker: Optional[str] = None
 
-        # Color palette iterator for initial colors (unique, reusable).
-        self._color_cycle = itertools.cycle(
-            [
-                "#1f77b4",  # blue
-                "#ff7f0e",  # orange
-                "#2ca02c",  # green
-                "#d62728",  # red
-                "#9467bd",  # purple
-                "#8c564b",  # brown
-                "#e377c2",  # pink
-                "#7f7f7f",  # gray
-            ]
-        )
+        # Fixed color palette for initial colors, walked with a plain index
+        # (modulo its length) so assignment is deterministic and the state
+        # is just an int that can be saved/restored with a session.
+        self._palette: List[str] = [
+            "#1f77b4",  # blue
+            "#ff7f0e",  # orange
+            "#2ca02c",  # green
+            "#d62728",  # red
+            "#9467bd",  # purple
+            "#8c564b",  # brown
+            "#e377c2",  # pink
+            "#7f7f7f",  # gray
+        ]
+        self._palette_idx = 0
 
         # Build UI controls.
         self._build_ui()
@@ -83,16 +91,25 @@ class SpeakerManager(tk.Frame):
         :param speaker_name: The speaker's name.
         :return: Hex color string.
         """
-        speaker = self._speakers.get(speaker_name)
-        if speaker is None:
-            return "#000000"
-        return str(speaker["color"])
+        return self._speaker_colors.get(speaker_name, "#000000")
+
+    def get_speaker_tag(self, speaker_name: str) -> str:
+        """
+        Get the transcript text-tag name used for a speaker.
+
+        :param speaker_name: The speaker's name.
+        :return: Tag name (interned for known speakers).
+        """
+        tag_name = self._speaker_tags.get(speaker_name)
+        if tag_name is None:
+            return f"{TimestampedText.SPEAKER_TAG_PREFIX}{speaker_name}"
+        return tag_name
 
     def get_speakers(self) -> List[str]:
         """
         Return a list of speaker names in insertion order.
         """
-        return list(self._speakers.keys())
+        return list(self._speaker_colors)
 
     def get_all_speakers(self) -> List[Dict[str, str]]:
         """
@@ -100,8 +117,8 @@ class SpeakerManager(tk.Frame):
         { "name": ..., "color": ... }.
         """
         return [
-            {"name": name, "color": str(data["color"])}
-            for name, data in self._speakers.items()
+            {"name": name, "color": color}
+            for name, color in self._speaker_colors.items()
         ]
 
     def set_active_speaker(self, name: str) -> None:
@@ -182,7 +199,7 @@ class SpeakerManager(tk.Frame):
         if not name:
             return
 
-        if name in self._speakers:
+        if name in self._speaker_colors:
             messagebox.showerror(
                 "Duplicate Speaker",
                 f"A speaker named '{name}' already exists.",
@@ -190,7 +207,7 @@ class SpeakerManager(tk.Frame):
             )
             return
 
-        color = next(self._color_cycle)
+        color = self._next_palette_color()
         self._add_speaker(name, color)
 
     def _on_add_speaker_clicked_with_name(self, name: str) -> None:
@@ -199,7 +216,7 @@ class SpeakerManager(tk.Frame):
         
         :param name: Speaker name to add.
         """
-        if name in self._speakers:
+        if name in self._speaker_colors:
             messagebox.showerror(
                 "Duplicate Speaker",
                 f"A speaker named '{name}' already exists.",
@@ -207,12 +224,22 @@ class SpeakerManager(tk.Frame):
             )
             return
 
-        color = next(self._color_cycle)
+        color = self._next_palette_color()
         self._add_speaker(name, color)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _next_palette_color(self) -> str:
+        """
+        Return the next color from the palette, wrapping around at the end.
+
+        :return: Hex color string.
+        """
+        color = self._palette[self._palette_idx % len(self._palette)]
+        self._palette_idx += 1
+        return color
+
     def _add_speaker(self, name: str, color: str) -> None:
         """
         Add a new speaker button.
@@ -232,7 +259,9 @@ class SpeakerManager(tk.Frame):
         # Bind double-click to edit speaker properties (name, color).
         button.bind("<Double-Button-1>", lambda event, n=name: self._edit_speaker(n))
 
-        self._speakers[name] = {"color": color, "button": button}
+        self._speaker_colors[name] = color
+        self._speaker_buttons[name] = button
+        self._speaker_tags[name] = self._make_speaker_tag(name)
 
         # NEW BEHAVIOR: the newly added speaker becomes the active one.
         self.set_active_speaker(name)
@@ -243,23 +272,25 @@ class SpeakerManager(tk.Frame):
 
         :param name: Speaker name to activate.
         """
-        if name not in self._speakers:
+        if name not in self._speaker_colors:
             return
 
-        self._active_speaker = name
-        color = self.get_speaker_color(name)
-
         # Give a visual hint (relief style) to indicate the active speaker.
-        for s_name, data in self._speakers.items():
-            button = data["button"]
-            if s_name == name:
-                button.configure(relief="sunken")
-            else:
-                button.configure(relief="raised")
+        # Only the previously active and the newly active buttons change,
+        # so a switch costs O(1) Tcl calls regardless of speaker count.
+        previous = self._active_speaker
+        if previous is not None and previous != name:
+            previous_button = self._speaker_buttons.get(previous)
+            if previous_button is not None:
+                previous_button.configure(relief="raised")
+
+        self._active_speaker = name
+        color = self._speaker_colors[name]
+        self._speaker_buttons[name].configure(relief="sunken")
 
         # Notify the app if a callback is provided.
         if self._on_active_speaker_changed is not None:
-            self._on_active_speaker_changed(name, color)
+            self._on_active_speaker_changed(name, color, self.get_speaker_tag(name))
 
     def _edit_speaker(self, old_name: str) -> None:
         """
@@ -267,12 +298,11 @@ class SpeakerManager(tk.Frame):
 
         :param old_name: Current speaker name.
         """
-        data = self._speakers.get(old_name)
-        if data is None:
+        if old_name not in self._speaker_colors:
             return
 
-        button: tk.Button = data["button"]  # type: ignore[assignment]
-        current_color = str(data["color"])
+        button = self._speaker_buttons[old_name]
+        current_color = self._speaker_colors[old_name]
 
         # Ask for a new name (pre-fill with old name).
         new_name = simpledialog.askstring(
@@ -294,8 +324,12 @@ class SpeakerManager(tk.Frame):
         button.configure(text=new_name, bg=new_color, activebackground=new_color)
 
         # Remove old entry and add new one.
-        del self._speakers[old_name]
-        self._speakers[new_name] = {"color": new_color, "button": button}
+        del self._speaker_colors[old_name]
+        del self._speaker_buttons[old_name]
+        del self._speaker_tags[old_name]
+        self._speaker_colors[new_name] = new_color
+        self._speaker_buttons[new_name] = button
+        self._speaker_tags[new_name] = self._make_speaker_tag(new_name)
 
         # Update active speaker name if needed.
         if self._active_speaker == old_name:
@@ -303,4 +337,16 @@ class SpeakerManager(tk.Frame):
 
         # Notify about active speaker change to propagate color/name.
         if self._on_active_speaker_changed is not None:
-            self._on_active_speaker_changed(new_name, new_color)
+            self._on_active_speaker_changed(
+                new_name, new_color, self.get_speaker_tag(new_name)
+            )
+
+    @staticmethod
+    def _make_speaker_tag(name: str) -> str:
+        """
+        Build the interned transcript text-tag name for a speaker.
+
+        :param name: Speaker name.
+        :return: Interned tag name, matching TimestampedText's convention.
+        """
+        return sys.intern(f"{TimestampedText.SPEAKER_TAG_PREFIX}{name}")
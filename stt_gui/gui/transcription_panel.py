@@ -13,9 +13,18 @@ from __future__ import annotations
 import re
 import tkinter as tk
 from typing import Callable, Optional, Tuple, List, Dict
-from datetime import datetime
 
-from .widgets import TimestampedText
+from .widgets import TimestampedText, format_timestamp
+
+# Compiled once at import: a full transcript line
+# "[timestamp] SpeakerName: text..." and its header-only prefix. `_LINE_RE`
+# is applied to the whole text at once, so it only allows horizontal
+# whitespace and never matches across a newline. Timestamps never contain
+# "]", so a negated class is used instead of a backtracking lazy ".*?".
+_LINE_RE = re.compile(
+    r"^\[([^\]\n]*)\][ \t]+([^:\n]+):[ \t]*(.*)$", re.MULTILINE
+)
+_HEADER_PREFIX_RE = re.compile(r"\[([^\]]*)\]\s+([^:]+):")
 
 
 class TranscriptionPanel(tk.Frame):
@@ -30,6 +39,7 @@ class TranscriptionPanel(tk.Frame):
         on_note_created: Optional[
             Callable[[str, str, str], None]
         ] = None,  # (speaker_name, speaker_color, timestamp_str)
+        speaker_color_lookup: Optional[Callable[[str], str]] = None,
         **kwargs,
     ) -> None:
         """
@@ -37,19 +47,35 @@ class TranscriptionPanel(tk.Frame):
 
         :param master: Parent widget.
         :param on_note_created: Callback invoked when a note is requested.
+        :param speaker_color_lookup: Optional callable mapping a speaker name
+                                     to its color (e.g. the SpeakerManager's
+                                     `get_speaker_color`). If omitted, the
+                                     color is read back from the text tags.
         :param kwargs: Extra options for tk.Frame.
         """
         super().__init__(master, **kwargs)
 
         self._on_note_created = on_note_created
+        self._speaker_color_lookup = speaker_color_lookup
 
         # Currently active speaker context (name and color).
         self._active_speaker_name: str = "Unknown"
         self._active_speaker_color: str = "#000000"
+        self._active_speaker_tag: Optional[str] = None
 
         # Store the last final segment's timestamp string for notes.
         self._last_timestamp_str: str = "unknown"
 
+        # Latest requested live-label content and the pending idle redraw
+        # (see update_live_partial); only the newest value is ever painted.
+        self._pending_partial: Optional[
+            Tuple[str, Optional[float], Optional[float]]
+        ] = None
+        self._partial_flush_id: Optional[str] = None
+
+        # String currently shown in the live label, to skip no-op writes.
+        self._last_live_text: str = ""
+
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -65,7 +91,12 @@ class TranscriptionPanel(tk.Frame):
         live_frame = tk.LabelFrame(self, text="Live transcription")
         live_frame.pack(fill="x", padx=4, pady=4)
 
-        self._live_label = tk.Label(live_frame, text="", anchor="w", justify="left")
+        # The label is bound to a StringVar: updating the variable is a
+        # leaner path than re-configuring the label's options.
+        self._live_var = tk.StringVar(master=self, value="")
+        self._live_label = tk.Label(
+            live_frame, textvariable=self._live_var, anchor="w", justify="left"
+        )
         self._live_label.pack(fill="x", padx=4, pady=4)
 
         # Editable sentences frame.
@@ -81,15 +112,21 @@ class TranscriptionPanel(tk.Frame):
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
-    def update_active_speaker(self, name: str, color: str) -> None:
+    def update_active_speaker(
+        self, name: str, color: str, tag_name: Optional[str] = None
+    ) -> None:
         """
         Update the active speaker context.
 
         :param name: New active speaker name.
         :param color: New active speaker color.
+        :param tag_name: Optional precomputed text tag for this speaker
+                         (see SpeakerManager.get_speaker_tag), reused for
+                         every inserted sentence.
         """
         self._active_speaker_name = name
         self._active_speaker_color = color
+        self._active_speaker_tag = tag_name
 
     def update_live_partial(
         self,
@@ -103,20 +140,40 @@ class TranscriptionPanel(tk.Frame):
         :param text: Partial text to display.
         :param start_time: Optional real-world start time (UNIX seconds).
         :param end_time: Optional real-world end time (UNIX seconds).
+
+        Updates are coalesced: the label is redrawn once, when Tk is next
+        idle, with the most recent values passed here.
         """
-        # If no text, clear the label.
-        if not text:
-            self._live_label.config(text="")
-            return
+        self._pending_partial = (text, start_time, end_time)
+        if self._partial_flush_id is None:
+            self._partial_flush_id = self.after_idle(self._flush_partial)
 
-        # If we do not have time information (e.g., "Wait, starting..."),
-        # show only the text.
-        if start_time is None or end_time is None:
-            self._live_label.config(text=text)
+    def _flush_partial(self) -> None:
+        """
+        Apply the latest pending live-label update (idle callback).
+        """
+        self._partial_flush_id = None
+        if self._pending_partial is None:
             return
+        text, start_time, end_time = self._pending_partial
+        self._pending_partial = None
 
-        timestamp_str = self._format_timestamp(start_time, end_time)
-        self._live_label.config(text=f"[{timestamp_str}] {text}")
+        # Compose the final display string: empty clears the label, and
+        # without time information (e.g., "Wait, starting...") show only
+        # the text.
+        if not text:
+            live_text = ""
+        elif start_time is None or end_time is None:
+            live_text = text
+        else:
+            timestamp_str = self._format_timestamp(start_time, end_time)
+            live_text = f"[{timestamp_str}] {text}"
+
+        # Vosk often repeats the same partial; only write when it changed.
+        if live_text == self._last_live_text:
+            return
+        self._last_live_text = live_text
+        self._live_var.set(live_text)
 
     def add_final_sentence(
         self,
@@ -140,47 +197,78 @@ class TranscriptionPanel(tk.Frame):
             start_time=start_time,
             end_time=end_time,
             text=text,
+            speaker_tag=self._active_speaker_tag,
         )
 
-    def get_sentences(self) -> List[Dict[str, str]]:
+    def add_final_sentences(
+        self,
+        sentences: List[Tuple[str, Optional[float], Optional[float]]],
+    ) -> None:
         """
-        Extract all sentences from the transcription area in a structured form.
+        Add several finalized sentences to the editable area at once.
 
-        Each line in the widget is of the form:
-            [timestamp] SpeakerName: text...
+        Equivalent to calling `add_final_sentence` for each entry, but the
+        text widget is scrolled only once at the end.
 
-        :return: List of dicts with keys: "timestamp", "speaker", "text".
+        :param sentences: List of (text, start_time, end_time) tuples, with
+                          times as UNIX timestamps (seconds).
         """
-        content = self._sentences_text.get("1.0", "end-1c")
-        lines = content.splitlines()
+        if not sentences:
+            return
 
-        results: List[Dict[str, str]] = []
+        self._sentences_text.insert_sentences(
+            speaker_name=self._active_speaker_name,
+            speaker_color=self._active_speaker_color,
+            sentences=sentences,
+            speaker_tag=self._active_speaker_tag,
+        )
 
-        pattern = re.compile(r"\[(.*?)\]\s+([^:]+):\s*(.*)")
+        _, start_time, end_time = sentences[-1]
+        self._last_timestamp_str = self._format_timestamp(start_time, end_time)
 
-        for line in lines:
-            if not line.strip():
-                continue
+    def get_sentences(self) -> List[Dict[str, str]]:
+        """
+        Extract all sentences from the transcription area in a structured form.
 
-            match = pattern.match(line)
-            if not match:
-                # If the line doesn't match the expected format, skip it.
-                continue
+        Each line in the widget is of the form:
+            [timestamp] SpeakerName: text...
 
-            timestamp_str = match.group(1)
-            speaker_name = match.group(2).strip()
-            text = match.group(3)
+        The text is only parsed if the user edited it since the last call.
 
-            results.append(
-                {
-                    "timestamp": timestamp_str,
-                    "speaker": speaker_name,
-                    "text": text,
-                }
-            )
+        :return: List of dicts with keys: "timestamp", "speaker", "text".
+        """
+        # Fast path: nothing was edited by hand, so the records kept at
+        # insertion time are exactly what the widget shows.
+        records = self._sentences_text.get_records()
+        if records is not None:
+            return records
+
+        content = self._sentences_text.get("1.0", "end-1c")
 
+        # One regex pass over the whole text; lines that don't match the
+        # expected format are simply skipped.
+        results = [
+            {
+                "timestamp": match[1],
+                "speaker": match[2].strip(),
+                "text": match[3],
+            }
+            for match in _LINE_RE.finditer(content)
+        ]
+
+        # Re-sync so later calls can use the fast path again.
+        self._sentences_text.reset_records(results)
         return results
 
+    def destroy(self) -> None:
+        """
+        Cancel a pending live-label redraw before the widget goes away.
+        """
+        if self._partial_flush_id is not None:
+            self.after_cancel(self._partial_flush_id)
+            self._partial_flush_id = None
+        super().destroy()
+
     # ------------------------------------------------------------------
     # Right-click note creation
     # ------------------------------------------------------------------
@@ -207,8 +295,14 @@ class TranscriptionPanel(tk.Frame):
         if speaker_name is None:
             speaker_name = self._active_speaker_name
 
-        # Retrieve the speaker color from the tags (or default).
-        speaker_color = self._get_speaker_color_for_line(line_start, speaker_name)
+        # Retrieve the speaker color: a direct lookup in the speaker registry
+        # if available, otherwise from the tags on this line (or default).
+        if self._speaker_color_lookup is not None:
+            speaker_color = self._speaker_color_lookup(speaker_name)
+        else:
+            speaker_color = self._get_speaker_color_for_line(
+                line_start, speaker_name
+            )
 
         if self._on_note_created is not None:
             # Create an empty note entry; the user can edit it in the notes panel.
@@ -224,7 +318,7 @@ class TranscriptionPanel(tk.Frame):
         :param line_text: The entire line as text.
         :return: (timestamp_str, speaker_name) tuple; any element may be None.
         """
-        match = re.match(r"\[(.*?)\]\s+([^:]+):", line_text)
+        match = _HEADER_PREFIX_RE.match(line_text)
         if not match:
             return None, None
         timestamp_str = match.group(1)
@@ -241,26 +335,26 @@ class TranscriptionPanel(tk.Frame):
         :param speaker_name: Speaker name.
         :return: Foreground color string, default black if unknown.
         """
-        speaker_tag = f"speaker_{speaker_name}"
-        index = line_start_index
-
-        while True:
-            # Get tags at this index.
-            tags = self._sentences_text.tag_names(index)
-            if speaker_tag in tags:
-                # Found a character with the speaker tag; return its color.
-                tag_color = self._sentences_text.tag_cget(speaker_tag, "foreground")
-                if tag_color:
-                    return str(tag_color)
-
-            # Move to the next character.
-            next_index = self._sentences_text.index(f"{index} + 1c")
-            if next_index == index:
-                break
-            if next_index.split(".")[0] != line_start_index.split(".")[0]:
-                # We moved to the next line; stop.
-                break
-            index = next_index
+        # Reuse the interned tag handed over by SpeakerManager when this is
+        # the active speaker; otherwise build the same name TimestampedText
+        # uses.
+        if (
+            self._active_speaker_tag is not None
+            and speaker_name == self._active_speaker_name
+        ):
+            speaker_tag = self._active_speaker_tag
+        else:
+            speaker_tag = f"{TimestampedText.SPEAKER_TAG_PREFIX}{speaker_name}"
+
+        # Jump straight to the first speaker-tagged range on this line
+        # (one Tk call) instead of walking the line character by character.
+        tagged_range = self._sentences_text.tag_nextrange(
+            speaker_tag, line_start_index, f"{line_start_index} lineend"
+        )
+        if tagged_range:
+            tag_color = self._sentences_text.tag_cget(speaker_tag, "foreground")
+            if tag_color:
+                return str(tag_color)
 
         return "#000000"
 
@@ -279,11 +373,4 @@ class TranscriptionPanel(tk.Frame):
         :param end_time: End time as UNIX timestamp (seconds).
         :return: "HH:MM:SS.mmm-HH:MM:SS.mmm" or "unknown" if not available.
         """
-        if start_time is None or end_time is None:
-            return "unknown"
-
-        def fmt(t: float) -> str:
-            dt = datetime.fromtimestamp(t)
-            return dt.strftime("%H:%M:%S.%f")[:-3]
-
-        return f"{fmt(start_time)}-{fmt(end_time)}"
+        return format_timestamp(start_time, end_time)
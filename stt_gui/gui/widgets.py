@@ -5,16 +5,51 @@ Here we define:
 - TimestampedText: a ScrolledText widget that protects timestamp
   segments from editing while allowing the rest of the text to be
   freely edited, and supports speaker color tagging.
+- format_timestamp: the shared "HH:MM:SS.mmm-HH:MM:SS.mmm" formatter.
 """
 
 from __future__ import annotations
 
 import tkinter as tk
 from tkinter import scrolledtext
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+@lru_cache(maxsize=4096)
+def _format_time_ms(t_ms: int) -> str:
+    """
+    Format a UNIX timestamp in milliseconds as local "HH:MM:SS.mmm".
+
+    Cached, since the same instants are formatted repeatedly (live label,
+    transcript line, notes).
+
+    :param t_ms: UNIX time in whole milliseconds.
+    :return: Formatted local time with millisecond precision.
+    """
+    dt = datetime.fromtimestamp(t_ms / 1000.0)
+    return dt.strftime("%H:%M:%S.%f")[:-3]
+
+
+def format_timestamp(start_time: Optional[float], end_time: Optional[float]) -> str:
+    """
+    Format a time range as a user-friendly string based on real-world time.
+
+    :param start_time: Start time as UNIX timestamp (seconds).
+    :param end_time: End time as UNIX timestamp (seconds).
+    :return: "HH:MM:SS.mmm-HH:MM:SS.mmm" or "unknown" if not available.
+    """
+    if start_time is None or end_time is None:
+        return "unknown"
+
+    # Truncate to whole milliseconds (the displayed precision) so the
+    # cache key is a small int rather than an arbitrary float.
+    start_str = _format_time_ms(int(start_time * 1000))
+    end_str = _format_time_ms(int(end_time * 1000))
+    return f"{start_str}-{end_str}"
+
+
 class TimestampedText(scrolledtext.ScrolledText):
     """
     Text widget where timestamp portions are marked as non-editable.
@@ -28,6 +63,16 @@ class TimestampedText(scrolledtext.ScrolledText):
     TIMESTAMP_TAG = "timestamp"
     SPEAKER_TAG_PREFIX = "speaker_"
 
+    # Keys that move the cursor or are pure modifiers; they never change the
+    # text, so they are let through without querying the tags at the cursor.
+    NON_EDITING_KEYSYMS = frozenset(
+        {
+            "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+            "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R",
+            "Meta_L", "Meta_R", "Super_L", "Super_R", "Caps_Lock", "Escape",
+        }
+    )
+
     def __init__(self, master: Optional[tk.Misc] = None, **kwargs) -> None:
         """
         Initialize the widget.
@@ -40,6 +85,17 @@ class TimestampedText(scrolledtext.ScrolledText):
         # Configure styling for the timestamp tag for visual distinction.
         self.tag_configure(self.TIMESTAMP_TAG, foreground="gray")
 
+        # Speaker tags configured so far, tracked on the Python side so
+        # inserts don't have to fetch every tag name from Tk.
+        self._configured_speaker_tags: set[str] = set()
+
+        # Structured copy of every inserted line ("timestamp", "speaker",
+        # "text"), so callers can read the transcript without parsing the
+        # widget text. It is only authoritative while the user has not
+        # edited the widget (tracked with Tk's "modified" flag).
+        self._records: List[Dict[str, str]] = []
+        self._records_stale = False
+
         # Bind to key events to protect timestamp regions.
         self.bind("<Key>", self._on_key)
 
@@ -50,12 +106,15 @@ class TimestampedText(scrolledtext.ScrolledText):
         :param event: Tkinter event for the key press.
         :return: "break" to cancel the key, or None to allow it.
         """
-        # Determine the insertion index before the key is applied.
-        index = self.index("insert")
+        # Navigation/modifier keys (including autorepeat bursts) can't edit
+        # anything: skip the Tk round-trip for them.
+        if event.keysym in self.NON_EDITING_KEYSYMS:
+            return None
 
-        # If the current index is inside a timestamp tag, block editing.
-        tags = self.tag_names(index)
-        if self.TIMESTAMP_TAG in tags:
+        # If the insertion cursor is inside a timestamp tag, block editing.
+        # tag_names accepts the "insert" mark directly, so no separate
+        # index() lookup is needed.
+        if self.TIMESTAMP_TAG in self.tag_names("insert"):
             # Returning "break" cancels the default behavior.
             return "break"
 
@@ -69,6 +128,7 @@ class TimestampedText(scrolledtext.ScrolledText):
         start_time: Optional[float],
         end_time: Optional[float],
         text: str,
+        speaker_tag: Optional[str] = None,
     ) -> None:
         """
         Insert a sentence with timestamp and speaker color.
@@ -78,35 +138,123 @@ class TimestampedText(scrolledtext.ScrolledText):
         :param start_time: Start time as UNIX timestamp (seconds since epoch).
         :param end_time: End time as UNIX timestamp (seconds since epoch).
         :param text: The recognized sentence text.
+        :param speaker_tag: Precomputed speaker tag name (SPEAKER_TAG_PREFIX +
+                            speaker_name); built here if omitted.
+        """
+        self._note_user_edits()
+        self._insert_line(
+            speaker_name, speaker_color, start_time, end_time, text, speaker_tag
+        )
+        self._mark_clean()
+
+        # Scroll to the end so the latest sentence is visible.
+        self.see("end")
+
+    def insert_sentences(
+        self,
+        speaker_name: str,
+        speaker_color: str,
+        sentences: List[Tuple[str, Optional[float], Optional[float]]],
+        speaker_tag: Optional[str] = None,
+    ) -> None:
+        """
+        Insert several sentences for the same speaker, scrolling only once.
+
+        :param speaker_name: Name of the speaker.
+        :param speaker_color: Color associated with the speaker.
+        :param sentences: List of (text, start_time, end_time) tuples, with
+                          times as UNIX timestamps (seconds since epoch).
+        :param speaker_tag: Precomputed speaker tag name (see
+                            `insert_sentence`).
+        """
+        if speaker_tag is None:
+            speaker_tag = f"{self.SPEAKER_TAG_PREFIX}{speaker_name}"
+
+        self._note_user_edits()
+        for text, start_time, end_time in sentences:
+            self._insert_line(
+                speaker_name, speaker_color, start_time, end_time, text, speaker_tag
+            )
+        self._mark_clean()
+
+        self.see("end")
+
+    def get_records(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Return a copy of the inserted lines, if they still match the text.
+
+        :return: List of dicts with keys "timestamp", "speaker", "text", or
+                 None if the user has edited the widget since the records
+                 were last synchronized (callers must then parse the text
+                 and pass the result to `reset_records`).
+        """
+        if self._records_stale or self.edit_modified():
+            self._records_stale = True
+            return None
+        return list(self._records)
+
+    def reset_records(self, records: List[Dict[str, str]]) -> None:
+        """
+        Replace the records with data parsed from the current text.
+
+        :param records: Lines parsed from the widget's current content.
+        """
+        self._records = list(records)
+        self._records_stale = False
+        self.edit_modified(False)
+
+    def _note_user_edits(self) -> None:
+        """
+        Before a programmatic insert: remember whether the user edited.
+        """
+        if not self._records_stale and self.edit_modified():
+            self._records_stale = True
+
+    def _mark_clean(self) -> None:
+        """
+        After a programmatic insert: don't count it as a user edit.
+        """
+        if not self._records_stale:
+            self.edit_modified(False)
+
+    def _insert_line(
+        self,
+        speaker_name: str,
+        speaker_color: str,
+        start_time: Optional[float],
+        end_time: Optional[float],
+        text: str,
+        speaker_tag: Optional[str] = None,
+    ) -> None:
+        """
+        Append one tagged transcript line (without scrolling).
         """
         # We format the timestamp and prepend it to the line.
         timestamp_str = self._format_timestamp(start_time, end_time)
         line_prefix = f"[{timestamp_str}] {speaker_name}: "
 
-        # Insert the timestamp and speaker label, tagging the timestamp.
-        start_index = self.index("end-1c")
-        self.insert("end", line_prefix)
-        end_index = self.index("end-1c")
-        self.tag_add(
-            self.TIMESTAMP_TAG,
-            start_index,
-            f"{start_index} + {len(line_prefix)}c",
-        )
-
-        # Insert the sentence text and mark it with a speaker-specific tag.
-        text_start = self.index("end-1c")
-        self.insert("end", text + "\n")
-        text_end = self.index("end-1c")
-
-        speaker_tag = f"{self.SPEAKER_TAG_PREFIX}{speaker_name}"
-        if speaker_tag not in self.tag_names():
+        # Mark the sentence text with a speaker-specific tag.
+        if speaker_tag is None:
+            speaker_tag = f"{self.SPEAKER_TAG_PREFIX}{speaker_name}"
+        if speaker_tag not in self._configured_speaker_tags:
             # Configure the speaker tag (foreground color) only once.
             self.tag_configure(speaker_tag, foreground=speaker_color)
+            self._configured_speaker_tags.add(speaker_tag)
 
-        self.tag_add(speaker_tag, text_start, text_end)
+        # Insert the whole line in a single Tcl call: Text.insert accepts
+        # (chars, tags) pairs, so the timestamp/speaker label and the
+        # sentence text are tagged as they are inserted.
+        self.insert(
+            "end",
+            line_prefix,
+            (self.TIMESTAMP_TAG,),
+            text + "\n",
+            (speaker_tag,),
+        )
 
-        # Scroll to the end so the latest sentence is visible.
-        self.see("end")
+        self._records.append(
+            {"timestamp": timestamp_str, "speaker": speaker_name, "text": text}
+        )
 
     def _format_timestamp(
         self,
@@ -120,12 +268,4 @@ class TimestampedText(scrolledtext.ScrolledText):
         :param end_time: End time as UNIX timestamp (seconds).
         :return: Formatted "HH:MM:SS.mmm-HH:MM:SS.mmm" or "unknown".
         """
-        if start_time is None or end_time is None:
-            return "unknown"
-
-        def fmt(t: float) -> str:
-            # Convert UNIX timestamp to local datetime and format with millis.
-            dt = datetime.fromtimestamp(t)
-            return dt.strftime("%H:%M:%S.%f")[:-3]
-
-        return f"{fmt(start_time)}-{fmt(end_time)}"
+        return format_timestamp(start_time, end_time)
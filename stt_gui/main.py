@@ -9,8 +9,6 @@ from __future__ import annotations
 
 import tkinter as tk
 
-from .gui.app import SpeechToTextApp
-
 
 def run() -> None:
     """
@@ -25,6 +23,12 @@ def run() -> None:
     # Set some basic window metadata for clarity.
     root.title("Local Speech-to-Text (Vosk)")
 
+    # Let the empty window appear before importing the GUI modules, so the
+    # user sees something while the rest of the package loads.
+    root.update_idletasks()
+
+    from .gui.app import SpeechToTextApp
+
     # Instantiate and pack our main application frame.
     app = SpeechToTextApp(master=root)
     app.pack(fill="both", expand=True)
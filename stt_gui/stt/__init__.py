@@ -3,5 +3,40 @@ Speech-to-text (STT) package.
 
 Includes:
 - A thin wrapper around Vosk (`vosk_engine`).
+- An optional variant running Vosk in a child process (`vosk_process`).
 - Sentence segmentation utilities (`sentence_segmenter`).
 """
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public names resolved lazily (PEP 562), so importing this package does not
+# pull in Vosk until the engine is actually needed.
+_LAZY_ATTRS = {
+    "STTResult": ".vosk_engine",
+    "VoskEngine": ".vosk_engine",
+    "VoskEngineProcess": ".vosk_process",
+    "SentenceSegmenter": ".sentence_segmenter",
+    "WordTiming": ".sentence_segmenter",
+    "WordTimings": ".sentence_segmenter",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodule defining `name` on first access.
+
+    :param name: Attribute name requested from the package.
+    :return: The resolved attribute.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
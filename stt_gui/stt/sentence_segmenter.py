@@ -9,9 +9,56 @@ and supports unit tests to validate the behavior.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
 
+import numpy as np
 
-@dataclass
+try:
+    # Optional: numba compiles the scalar boundary scan to machine code.
+    import numba
+except ImportError:
+    numba = None
+
+
+def _scan_boundaries_numpy(
+    starts: np.ndarray, ends: np.ndarray, threshold: float
+) -> np.ndarray:
+    """
+    Return the indices of words that start a new sentence (NumPy version).
+    """
+    return (np.flatnonzero((starts[1:] - ends[:-1]) >= threshold) + 1).astype(
+        np.int32
+    )
+
+
+def _scan_boundaries_loop(
+    starts: np.ndarray, ends: np.ndarray, threshold: float
+) -> np.ndarray:
+    """
+    Return the indices of words that start a new sentence, in one pass.
+
+    This is the body of the numba-compiled scan. Uncompiled it is slow,
+    but it stays importable so tests can compare it with the NumPy version
+    even without numba.
+    """
+    n_words = starts.shape[0]
+    out = np.empty(max(n_words - 1, 0), dtype=np.int32)
+    count = 0
+    for i in range(1, n_words):
+        if starts[i] - ends[i - 1] >= threshold:
+            out[count] = i
+            count += 1
+    # Copy so callers get a fresh contiguous array, like the NumPy version.
+    return out[:count].copy()
+
+
+if numba is not None:
+    _scan_boundaries = numba.njit(cache=True)(_scan_boundaries_loop)
+else:
+    _scan_boundaries = _scan_boundaries_numpy
+
+
+@dataclass(slots=True)
 class WordTiming:
     """
     Simple structure representing a word with start and end times.
@@ -25,6 +72,80 @@ class WordTiming:
     end: float
 
 
+@dataclass(slots=True)
+class WordTimings:
+    """
+    Word timings for a whole segment, stored column-wise (struct of arrays).
+
+    `starts[i]` and `ends[i]` are the times of `words[i]`. Keeping the times
+    in contiguous float arrays lets gap and boundary computations run as
+    NumPy operations over the whole segment; indexing returns a single
+    `WordTiming` record for callers that want one word at a time.
+    """
+
+    words: List[str]
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_vosk(cls, result: Sequence[Dict[str, Any]]) -> "WordTimings":
+        """
+        Build word timings from a Vosk "result" list.
+
+        :param result: List of dicts with "word", "start" and "end" keys,
+                       as produced by a recognizer with SetWords(True).
+        :return: A new WordTimings instance.
+        :raises KeyError: If a word lacks one of those keys (no timings are
+                          made up for it).
+        """
+        count = len(result)
+        return cls(
+            words=[item["word"] for item in result],
+            starts=np.fromiter(
+                (item["start"] for item in result),
+                dtype=np.float64,
+                count=count,
+            ),
+            ends=np.fromiter(
+                (item["end"] for item in result),
+                dtype=np.float64,
+                count=count,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def split(self, indices: Sequence[int]) -> List["WordTimings"]:
+        """
+        Split into consecutive pieces, each starting at one of `indices`.
+
+        The time arrays are split with `np.split`, so the pieces are views
+        sharing memory with this instance.
+
+        :param indices: Sorted word indices where new pieces start (as
+                        returned by `SentenceSegmenter.split_indices`).
+        :return: List of len(indices) + 1 WordTimings.
+        """
+        bounds = [0, *indices, len(self.words)]
+        return [
+            WordTimings(words=self.words[lo:hi], starts=starts, ends=ends)
+            for lo, hi, starts, ends in zip(
+                bounds,
+                bounds[1:],
+                np.split(self.starts, indices),
+                np.split(self.ends, indices),
+            )
+        ]
+
+    def __getitem__(self, index: int) -> WordTiming:
+        return WordTiming(
+            word=self.words[index],
+            start=float(self.starts[index]),
+            end=float(self.ends[index]),
+        )
+
+
 class SentenceSegmenter:
     """
     Basic pause-based sentence segmentation.
@@ -53,3 +174,54 @@ class SentenceSegmenter:
         """
         gap = next_start - prev_end
         return gap >= self.pause_threshold_sec
+
+    def make_predicate(self) -> Callable[[float, float], bool]:
+        """
+        Return an `is_boundary` equivalent with the threshold baked in.
+
+        The returned function skips the attribute lookups of the method, for
+        tight Python loops; it does not see later changes to
+        `pause_threshold_sec`.
+
+        :return: Function (prev_end, next_start) -> bool.
+        """
+        threshold = self.pause_threshold_sec
+
+        def is_boundary(prev_end: float, next_start: float) -> bool:
+            return next_start - prev_end >= threshold
+
+        return is_boundary
+
+    def boundaries(self, ends: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        Vectorized `is_boundary` over consecutive words.
+
+        :param ends: End times of the words, in order (in seconds).
+        :param starts: Start times of the same words (in seconds).
+        :return: Boolean mask of length len(words) - 1; element i is True
+                 if there is a boundary between word i and word i + 1.
+        """
+        return np.greater_equal(starts[1:] - ends[:-1], self.pause_threshold_sec)
+
+    def split_indices(self, ends: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        Indices of the words that start a new sentence.
+
+        Equivalent to `np.flatnonzero(self.boundaries(ends, starts)) + 1`,
+        computed by a single compiled loop when numba is installed.
+
+        :param ends: End times of the words, in order (in seconds).
+        :param starts: Start times of the same words (in seconds).
+        :return: Sorted int32 array of word indices (never includes 0).
+        """
+        return _scan_boundaries(starts, ends, float(self.pause_threshold_sec))
+
+    def warm_up(self) -> None:
+        """
+        Run `split_indices` once on dummy data.
+
+        With numba this triggers compilation (or loads it from the on-disk
+        cache) up front, so the first real segment does not pay for it.
+        """
+        dummy = np.zeros(2, dtype=np.float64)
+        self.split_indices(dummy, dummy)
@@ -10,16 +10,63 @@ IMPORTANT:
 from __future__ import annotations
 
 import json
+import os
+import re
 import threading
-import queue
 import sys
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from vosk import Model, KaldiRecognizer
 
-@dataclass
+try:
+    # The binding's cffi handles, used to pass audio buffers to Vosk without
+    # first copying them into `bytes` (KaldiRecognizer.AcceptWaveform only
+    # accepts `bytes`). Not public API, hence the fallback.
+    from vosk import _c as _vosk_c, _ffi as _vosk_ffi
+except ImportError:
+    _vosk_c = None
+    _vosk_ffi = None
+
+# Whether this binding exposes what the zero-copy feed needs. Checked once
+# here (plus the recognizer's handle in _waveform_feeder) rather than per
+# block, so errors raised by the call itself are never mistaken for a
+# missing API.
+_ZERO_COPY_FEED: bool = hasattr(
+    _vosk_c, "vosk_recognizer_accept_waveform"
+) and hasattr(_vosk_ffi, "from_buffer")
+
+from ..config.settings import (
+    AUDIO_CHUNK_BYTES,
+    RESULT_QUEUE_MAXLEN,
+    SAMPLE_RATE,
+    SENTENCE_PAUSE_THRESHOLD_SEC,
+    STT_MAX_BATCH_BYTES,
+    STT_WORKER_CPU,
+)
+from .sentence_segmenter import SentenceSegmenter, WordTimings
+
+try:
+    # Optional: orjson decodes Vosk's result JSON several times faster.
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON decoder for recognizer results. The Vosk binding returns `str`,
+# which both decoders accept directly.
+_json_loads: Callable[[str], dict] = (
+    orjson.loads if orjson is not None else json.loads
+)
+
+# Fast path for PartialResult JSON (`{"partial" : "..."}`): grab the string
+# value without building a dict. Backslashes are excluded, so any escaped
+# value fails to match and falls back to a full parse.
+_PARTIAL_RE = re.compile(r'"partial"\s*:\s*"([^"\\]*)"')
+
+
+@dataclass(slots=True)
 class STTResult:
     """
     Represents a speech recognition result.
@@ -31,51 +78,380 @@ class STTResult:
         - recognized text
     start_time, end_time:
         - relative times from Vosk (NOT wall clock times)
+
+    Results are produced at the partial-result rate, so instances are
+    recycled: the engine takes them with `acquire` and the consumer hands
+    them back with `release` once it has read the fields. A released
+    result must not be used again by the caller.
     """
+
     type: str
     text: str
     start_time: Optional[float] = None
     end_time: Optional[float] = None
 
+    @classmethod
+    def acquire(
+        cls,
+        type: str,
+        text: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> "STTResult":
+        """
+        Return a result with the given fields, reusing a released one if any.
+        """
+        try:
+            result = _stt_result_freelist.pop()
+        except IndexError:
+            return cls(type, text, start_time, end_time)
+
+        result.type = type
+        result.text = text
+        result.start_time = start_time
+        result.end_time = end_time
+        return result
+
+    def release(self) -> None:
+        """
+        Return this result to the pool for reuse.
+        """
+        # Drop the text reference so pooled objects do not pin strings.
+        self.text = ""
+        _stt_result_freelist.append(self)
+
+
+# Freelist backing STTResult.acquire/release (LIFO, so recently used and
+# cache-warm objects are reused first). deque.append/pop are atomic in
+# CPython, so the engine thread and GUI thread need no extra lock; maxlen
+# bounds how many idle objects are kept around.
+_stt_result_freelist: "deque[STTResult]" = deque(maxlen=RESULT_QUEUE_MAXLEN)
+
+
+def _push_result(queue: "deque[STTResult]", result: STTResult) -> bool:
+    """
+    Append a result to a result queue, superseding a stale partial.
+
+    A partial still waiting at the tail of the queue is superseded by any
+    newer result, so it is removed (and released) first; the queue
+    therefore never backs up with stale partials. This is safe without a
+    lock as long as the caller is the queue's only producer: the tail can
+    then only disappear if the consumer drains the deque completely, in
+    which case `pop` raises IndexError and there is nothing to remove.
+
+    :param queue: Result deque shared with the consumer.
+    :param result: Result to append.
+    :return: True if the queue was bounded and full, so appending dropped
+             its oldest entry.
+    """
+    try:
+        if queue[-1].type == "partial":
+            queue.pop().release()
+    except IndexError:
+        pass
+
+    full = queue.maxlen is not None and len(queue) >= queue.maxlen
+    queue.append(result)
+    return full
+
+
+def _waveform_feeder(
+    recognizer: KaldiRecognizer,
+) -> Callable[[memoryview], bool]:
+    """
+    Return a function feeding raw audio to `recognizer`.
+
+    The returned function passes the buffer to Vosk in place when the
+    binding allows it (see _ZERO_COPY_FEED) and otherwise copies it into
+    `bytes` for the public AcceptWaveform. The choice is made here, once
+    per recognizer.
+
+    :param recognizer: Recognizer to feed.
+    :return: Function taking raw int16 audio bytes (any contiguous buffer)
+             and returning True if the recognizer finalized an utterance.
+    """
+    handle = getattr(recognizer, "_handle", None)
+    if not _ZERO_COPY_FEED or handle is None:
+
+        def accept_copy(chunk: memoryview) -> bool:
+            return bool(recognizer.AcceptWaveform(bytes(chunk)))
+
+        return accept_copy
+
+    accept = _vosk_c.vosk_recognizer_accept_waveform
+    from_buffer = _vosk_ffi.from_buffer
+
+    def accept_in_place(chunk: memoryview) -> bool:
+        # from_buffer wraps the existing memory as a char[]; no data is
+        # copied.
+        res = accept(handle, from_buffer(chunk), len(chunk))
+        if res < 0:
+            raise RuntimeError("Failed to process waveform")
+        return bool(res)
+
+    return accept_in_place
+
+
+# Model files smaller than this are not worth a readahead hint.
+_PREFETCH_MIN_BYTES = 1 << 20
+
+
+def _prefetch_model_files(model_path: Path) -> None:
+    """
+    Ask the kernel to start reading a model's large files into page cache.
+
+    posix_fadvise(WILLNEED) only schedules the reads and returns, so this
+    is cheap; run in a thread next to Model(), the disk reads overlap with
+    Vosk's own parsing. A no-op where posix_fadvise is unavailable.
+
+    :param model_path: Directory of the Vosk model.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for root, _dirs, files in os.walk(model_path):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                if os.fstat(fd).st_size >= _PREFETCH_MIN_BYTES:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                # Only a hint: ignore filesystems that do not support it.
+                pass
+            finally:
+                os.close(fd)
+
+
+def _pin_current_thread(cpu: int) -> None:
+    """
+    Pin the calling thread to one CPU core, where the platform allows it.
+
+    :param cpu: Core index; negative values count from the last usable core.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        # Linux: pid 0 means the calling thread.
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[cpu]})
+    elif sys.platform == "win32":
+        import ctypes
+
+        count = os.cpu_count() or 1
+        core = cpu % count if cpu < 0 else cpu
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentThread.restype = ctypes.c_void_p
+        kernel32.SetThreadAffinityMask.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+        ]
+        thread = kernel32.GetCurrentThread()
+        if not kernel32.SetThreadAffinityMask(thread, 1 << core):
+            raise ctypes.WinError()
+    # Other platforms (e.g. macOS) have no thread affinity API: do nothing.
+
+
+# Final segments with at most this many words (nearly all of them) are split
+# into sentences by a Python loop; longer ones by SentenceSegmenter's
+# vectorized scan, whose array setup only pays off on long segments.
+_SCALAR_SPLIT_MAX_WORDS = 64
+
+
+def _sentence(words: list, lo: int, hi: int) -> tuple[str, float, float]:
+    """
+    Build the (text, start_time, end_time) of words[lo:hi] of a Vosk result.
+    """
+    return (
+        " ".join(item["word"] for item in words[lo:hi]),
+        words[lo]["start"],
+        words[hi - 1]["end"],
+    )
+
+
+class _RecognizerPool:
+    """
+    Small pool of ready-to-use KaldiRecognizer instances for one model.
+
+    Building a recognizer initializes Kaldi's feature pipeline, which is
+    slow; recycling them turns a Start after a Stop (or another engine on
+    the same model) into a deque pop. Recognizers are created lazily and at
+    most `max_size` idle ones are kept.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        sample_rate: int,
+        max_size: int = 2,
+        preload: int = 0,
+    ) -> None:
+        """
+        :param model: Loaded Vosk model shared by all recognizers.
+        :param sample_rate: Audio sample rate in Hz.
+        :param max_size: Maximum number of idle recognizers kept.
+        :param preload: Number of recognizers to build right away.
+        """
+        self._model = model
+        self._sample_rate = sample_rate
+        self._idle: "deque[KaldiRecognizer]" = deque(maxlen=max_size)
+        for _ in range(min(preload, max_size)):
+            self._idle.append(self._create())
+
+    def _create(self) -> KaldiRecognizer:
+        recognizer = KaldiRecognizer(self._model, self._sample_rate)
+        recognizer.SetWords(True)
+        return recognizer
+
+    def acquire(self) -> KaldiRecognizer:
+        """
+        Return an idle recognizer, creating one if the pool is empty.
+        """
+        try:
+            return self._idle.pop()
+        except IndexError:
+            return self._create()
+
+    def release(self, recognizer: KaldiRecognizer) -> None:
+        """
+        Reset a recognizer and return it to the pool.
+
+        FinalResult() drains any buffered audio so the next user starts
+        from a clean state; if the pool is full, the oldest idle recognizer
+        is dropped.
+        """
+        recognizer.FinalResult()
+        self._idle.append(recognizer)
+
 
 class VoskEngine:
     """
     Runs a Vosk KaldiRecognizer in a background thread.
 
-    Audio bytes are read from audio_queue.
-    Recognition results are pushed into result_queue.
+    Audio chunks (memoryviews over pooled buffers) are popped from
+    audio_queue.
+    Recognition results are appended to result_queue.
+
+    Both are `collections.deque` objects used as single-producer,
+    single-consumer FIFOs: `append`/`popleft` are atomic in CPython,
+    so no extra locking is needed.
+
+    If audio_queue is None the engine runs in direct mode: no thread is
+    started and the caller pushes each block through `feed` (e.g. from the
+    audio callback); `stop` then only flushes the final result.
     """
 
     def __init__(
         self,
         model_path: Path,
-        audio_queue: "queue.Queue[bytes]",
-        result_queue: "queue.Queue[STTResult]",
+        audio_queue: "Optional[deque[memoryview]]",
+        result_queue: "deque[STTResult]",
+        audio_ready: Optional[threading.Event] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
     ) -> None:
         self._model_path = model_path
         self._audio_queue = audio_queue
         self._result_queue = result_queue
+        self._on_error = on_error
+
+        # Number of results discarded because result_queue was full, and
+        # whether the last append dropped one (a run of drops is reported
+        # once).
+        self.dropped_results = 0
+        self._dropping_results = False
 
-        self._running = False
+        # Set by the producer after each append; lets the worker sleep
+        # instead of spinning when no audio is pending.
+        self._audio_ready = audio_ready or threading.Event()
+
+        # Set while the engine is stopped (initially, and after stop());
+        # the worker checks it on every wakeup instead of polling on a timer.
+        self._stop_evt = threading.Event()
+        self._stop_evt.set()
         self._thread: Optional[threading.Thread] = None
 
-        # Load model
+        # Hashes of the last raw PartialResult/Result strings, and the last
+        # emitted partial text. Vosk repeats the same partial while a word
+        # stabilizes, and the same empty final after each stretch of
+        # silence; these let us skip parsing and re-emitting them.
+        self._last_partial_hash: Optional[int] = None
+        self._last_final_hash: Optional[int] = None
+        self._last_partial_text: str = ""
+
+        # Splits final segments into sentences at long pauses. Short
+        # segments are scanned in Python with the bound predicate; longer
+        # ones with the segmenter's vectorized scan.
+        self._segmenter = SentenceSegmenter(SENTENCE_PAUSE_THRESHOLD_SEC)
+        self._segmenter.warm_up()
+        self._is_boundary = self._segmenter.make_predicate()
+
+        # Prime the page cache for the model files in the background, so
+        # the disk reads overlap with the (synchronous) model load.
+        threading.Thread(
+            target=_prefetch_model_files, args=(self._model_path,), daemon=True
+        ).start()
+
+        # Load model. One recognizer is built up front so the first start()
+        # does not pay for it; start() takes one from the pool and stop()
+        # gives it back.
         self._model = Model(str(self._model_path))
-        self._recognizer = KaldiRecognizer(self._model, 16000)
-        self._recognizer.SetWords(True)
+        self._recognizers = _RecognizerPool(self._model, SAMPLE_RATE, preload=1)
+        self._recognizer: Optional[KaldiRecognizer] = None
+        self._accept_waveform: Optional[Callable[[memoryview], bool]] = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def start(self) -> None:
-        self._running = True
+        if self._recognizer is None:
+            self._recognizer = self._recognizers.acquire()
+            self._accept_waveform = _waveform_feeder(self._recognizer)
+        self._stop_evt.clear()
+        if self._audio_queue is None:
+            # Direct mode: blocks arrive through feed().
+            return
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
-        self._running = False
-        if self._thread:
-            self._thread.join(timeout=1.0)
+        self._stop_evt.set()
+        # Wake the worker if it is waiting for audio so it sees the stop.
+        self._audio_ready.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout=1.0)
+            self._thread = None
+            if thread.is_alive():
+                # Still busy inside Vosk; keep the recognizer rather than
+                # recycling it under the worker's feet.
+                return
+        elif self._audio_queue is None and self._recognizer is not None:
+            # Direct mode has no worker thread to flush the final result.
+            self._flush_final_result()
+
+        if self._recognizer is not None:
+            self._recognizers.release(self._recognizer)
+            self._recognizer = None
+            self._accept_waveform = None
+
+    def close(self) -> None:
+        """
+        Stop the engine; it holds no other OS resources to release.
+        """
+        self.stop()
+
+    def feed(self, chunk: memoryview) -> None:
+        """
+        Process one audio block synchronously on the calling thread.
+
+        Used in direct mode, where the audio callback calls this instead of
+        queueing the block. Blocks arriving while stopped are ignored.
+
+        :param chunk: Raw int16 audio bytes (any buffer-protocol object).
+        """
+        if not self._stop_evt.is_set():
+            self._process_chunk(chunk)
 
     # ------------------------------------------------------------------
     # Background loop
@@ -84,22 +460,115 @@ class VoskEngine:
         """
         Continuously read audio chunks and process them with Vosk.
         """
-        while self._running:
+        if STT_WORKER_CPU is not None:
+            try:
+                _pin_current_thread(STT_WORKER_CPU)
+            except (OSError, IndexError) as exc:
+                # Not fatal: the worker just runs unpinned.
+                if self._on_error is not None:
+                    self._on_error(
+                        OSError(
+                            "Could not pin STT worker to CPU "
+                            f"{STT_WORKER_CPU}: {exc}"
+                        )
+                    )
+
+        # If several blocks are already queued (we fell behind), feed up to
+        # this many to Vosk in a single call to amortize its overhead. They
+        # are copied into one buffer allocated here, once per run, instead
+        # of joining them into a fresh bytes object per batch.
+        max_batch = max(1, STT_MAX_BATCH_BYTES // AUDIO_CHUNK_BYTES)
+        batch: list[memoryview] = []
+        batch_view = memoryview(bytearray(max_batch * AUDIO_CHUNK_BYTES))
+
+        # Bind the attributes used on every iteration to locals once, so the
+        # loop does not repeat the `self.` and method lookups per block.
+        stopped = self._stop_evt.is_set
+        popleft = self._audio_queue.popleft
+        wait_for_audio = self._audio_ready.wait
+        clear_audio_ready = self._audio_ready.clear
+        process_chunk = self._process_chunk
+        batch_append = batch.append
+        batch_clear = batch.clear
+
+        while not stopped():
             try:
-                chunk = self._audio_queue.get(timeout=0.1)
-            except queue.Empty:
+                chunk = popleft()
+            except IndexError:
+                # Nothing pending: sleep until the producer (or stop())
+                # signals, then re-check. Clearing after the wait is safe
+                # because we always retry popleft() before waiting again,
+                # and stop() sets _stop_evt before waking us.
+                wait_for_audio()
+                clear_audio_ready()
                 continue
 
-            if self._recognizer.AcceptWaveform(chunk):
-                raw = json.loads(self._recognizer.Result())
-                self._handle_final_result(raw)
+            batch_append(chunk)
+            while len(batch) < max_batch:
+                try:
+                    batch_append(popleft())
+                except IndexError:
+                    break
+
+            if len(batch) == 1:
+                # Lone block: Vosk reads the pooled buffer in place.
+                process_chunk(chunk)
             else:
-                raw = json.loads(self._recognizer.PartialResult())
-                self._handle_partial_result(raw)
+                # Copy the blocks back to back into the batch buffer for a
+                # single Vosk call (the only copy on this path).
+                total = 0
+                for block in batch:
+                    end = total + len(block)
+                    batch_view[total:end] = block
+                    total = end
+                process_chunk(batch_view[:total])
+            batch_clear()
 
         # Emit final result when stopping
+        self._flush_final_result()
+
+    def _process_chunk(self, chunk: memoryview) -> None:
+        """
+        Run one audio block (or a batch of blocks) through the recognizer
+        and emit its result.
+        """
+        recognizer = self._recognizer
+
+        # Chunks are views over AudioStream's buffer pool (or PortAudio's
+        # buffer in direct mode) and are handed to Vosk in place.
+        if self._accept_waveform(chunk):
+            # A final closes the utterance even when it repeats the previous
+            # one: the next partial is new even if its text is not.
+            self._last_partial_hash = None
+            self._last_partial_text = ""
+
+            final_raw = recognizer.Result()
+            final_hash = hash(final_raw)
+            if final_hash == self._last_final_hash:
+                # Identical to the previous final; with word timings enabled
+                # that only happens for repeated empty results.
+                return
+            self._last_final_hash = final_hash
+            self._handle_final_result(_json_loads(final_raw))
+        else:
+            partial_raw = recognizer.PartialResult()
+            partial_hash = hash(partial_raw)
+            if partial_hash == self._last_partial_hash:
+                # Same partial as last block: nothing new to parse or show.
+                return
+            self._last_partial_hash = partial_hash
+            match = _PARTIAL_RE.search(partial_raw)
+            if match is not None:
+                self._handle_partial_text(match.group(1))
+            else:
+                self._handle_partial_result(_json_loads(partial_raw))
+
+    def _flush_final_result(self) -> None:
+        """
+        Emit whatever the recognizer still holds as a final result.
+        """
         try:
-            raw = json.loads(self._recognizer.FinalResult())
+            raw = _json_loads(self._recognizer.FinalResult())
             self._handle_final_result(raw)
         except Exception:
             pass
@@ -111,12 +580,19 @@ class VoskEngine:
         """
         Handle a partial Vosk result.
         """
-        text = raw.get("partial", "").strip()
-        if not text:
+        self._handle_partial_text(raw.get("partial", ""))
+
+    def _handle_partial_text(self, text: str) -> None:
+        """
+        Emit the text of a partial result, unless empty or unchanged.
+        """
+        text = text.strip()
+        if not text or text == self._last_partial_text:
             return
+        self._last_partial_text = text
 
-        self._result_queue.put(
-            STTResult(
+        self._emit(
+            STTResult.acquire(
                 type="partial",
                 text=text,
                 start_time=None,
@@ -127,26 +603,124 @@ class VoskEngine:
     def _handle_final_result(self, raw: dict) -> None:
         """
         Handle a final Vosk result.
-        Extract start/end offsets from 'result' list.
+        Extract start/end offsets from 'result' list, emitting one final
+        result per sentence (split at pauses >= the segmenter threshold).
         """
+        # A final closes the utterance: the next partial is new even if its
+        # text happens to repeat the previous one. (_process_chunk resets
+        # this too; the flush path on stop only comes through here.)
+        self._last_partial_hash = None
+        self._last_partial_text = ""
+
         text = raw.get("text", "").strip()
         if not text:
             return
 
-        words = raw.get("result", [])
-        if words:
-            start_time = float(words[0].get("start", 0.0))
-            end_time = float(words[-1].get("end", 0.0))
-        else:
-            start_time = None
-            end_time = None
+        try:
+            sentences = self._split_sentences(text, raw.get("result", []))
+        except (KeyError, IndexError):
+            # No word list, or a word without timing (Vosk always sets
+            # "start"/"end" with SetWords(True)): keep the text, and leave
+            # the times unknown rather than making them up.
+            sentences = [(text, None, None)]
+
+        for sentence, start_time, end_time in sentences:
+            self._emit_final(sentence, start_time, end_time)
+
+    def _split_sentences(
+        self, text: str, words: list
+    ) -> list[tuple[str, float, float]]:
+        """
+        Split a final segment into sentences at long pauses.
+
+        Nothing is emitted here, so a malformed word (KeyError) or an empty
+        word list (IndexError) can be handled by the caller as a whole.
+
+        :param text: Text of the whole segment.
+        :param words: Vosk "result" list for the segment.
+        :return: (text, start_time, end_time) per sentence, in order.
+        """
+        if len(words) < 2:
+            # Vosk timings are already JSON numbers: no float() needed.
+            return [(text, words[0]["start"], words[-1]["end"])]
 
+        if len(words) <= _SCALAR_SPLIT_MAX_WORDS:
+            # Short segment: a plain loop over the word pairs with the bound
+            # predicate is cheaper than building arrays for a few words.
+            is_boundary = self._is_boundary
+            sentences = []
+            first = 0
+            prev_end = words[0]["end"]
+            for i in range(1, len(words)):
+                start = words[i]["start"]
+                if is_boundary(prev_end, start):
+                    sentences.append(_sentence(words, first, i))
+                    first = i
+                prev_end = words[i]["end"]
+
+            if not sentences:
+                return [(text, words[0]["start"], prev_end)]
+            sentences.append(_sentence(words, first, len(words)))
+            return sentences
+
+        # Long segment: split where the pause between two words reaches the
+        # threshold with one vectorized (or numba-compiled) scan over all
+        # the words instead of a Python-level call per word pair.
+        timings = WordTimings.from_vosk(words)
+        starts, ends = timings.starts, timings.ends
+        split_at = self._segmenter.split_indices(ends, starts)
+
+        if not split_at.size:
+            return [(text, float(starts[0]), float(ends[-1]))]
+
+        return [
+            (
+                " ".join(sentence.words),
+                float(sentence.starts[0]),
+                float(sentence.ends[-1]),
+            )
+            for sentence in timings.split(split_at.tolist())
+        ]
+
+    def _emit_final(
+        self,
+        text: str,
+        start_time: Optional[float],
+        end_time: Optional[float],
+    ) -> None:
+        """
+        Emit one final (sentence) result.
+        """
         # No GUI reference here — GUI handles conversion to wall time
-        self._result_queue.put(
-            STTResult(
+        self._emit(
+            STTResult.acquire(
                 type="final",
                 text=text,
                 start_time=start_time,
                 end_time=end_time,
             )
         )
+
+    def _emit(self, result: STTResult) -> None:
+        """
+        Append a result for the GUI (see `_push_result`).
+
+        If result_queue is bounded and full (e.g., the Tk main loop is
+        stalled), the deque drops its oldest entry; the drop is counted,
+        and the first drop of each run is reported through `on_error`.
+        """
+        if not _push_result(self._result_queue, result):
+            self._dropping_results = False
+            return
+
+        # Report each run of drops once, not every dropped result: the
+        # consumer is already behind, so flooding it would not help.
+        self.dropped_results += 1
+        if not self._dropping_results and self._on_error is not None:
+            self._on_error(
+                OverflowError(
+                    "STT result queue full; dropping oldest results "
+                    f"({self.dropped_results} dropped so far)"
+                )
+            )
+        self._dropping_results = True
@@ -0,0 +1,455 @@
+"""
+VoskEngineProcess: runs the Vosk recognizer in a separate process.
+
+Same interface as `VoskEngine` (audio deque in, STTResult deque out), but
+recognition happens in a child process, so the Python work between Vosk
+calls never competes with the Tk main loop for the GIL.
+
+Data flow:
+- A pump thread in the GUI process pops audio blocks from audio_queue and
+  copies them into a shared-memory ring (single producer, single consumer).
+- The child process reads blocks from the ring and feeds a `VoskEngine`
+  running in direct mode.
+- Results come back as small tuples over a `multiprocessing.Queue`; a
+  reader thread turns them into `STTResult` objects on result_queue.
+
+This is opt-in (see STT_ENGINE_IN_PROCESS in settings): it costs an extra
+process and some IPC per result, which only pays off when the GUI thread
+is busy enough to slow recognition down.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..config.settings import AUDIO_CHUNK_BYTES, AUDIO_QUEUE_MAXLEN
+from .vosk_engine import STTResult, VoskEngine, _push_result
+
+# The ring starts with a small header of two uint64 counters, padded to a
+# cache line: [0] blocks written by the parent, [1] blocks consumed by the
+# child. Each counter has a single writer, so no lock is needed.
+_HEADER_BYTES = 64
+_WRITTEN = 0
+_CONSUMED = 1
+
+# How often (in seconds) each side checks that the other process is still
+# alive while idle, and how long the parent waits for the child to
+# acknowledge a stop.
+_LIVENESS_CHECK_INTERVAL_SEC = 1.0
+_STOP_TIMEOUT_SEC = 5.0
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Open the parent's ring without registering it with the resource tracker.
+
+    The parent created the block and unlinks it in close(). A tracked
+    attach would register it a second time; with its own tracker the child
+    would then unlink it (with a "leaked shared_memory" warning) when it
+    exits. Before Python 3.13 there is no `track=False`, and unregistering
+    after the fact is no better: spawned children share the parent's
+    tracker, so that would drop the parent's own registration. Registration
+    is therefore skipped while the block is opened.
+
+    :param name: Name of the shared memory block.
+    :return: The attached block.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _ring_arrays(
+    shm: SharedMemory, n_slots: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Map the header counters and the block slots of a ring buffer.
+
+    :param shm: Shared memory block holding the ring.
+    :param n_slots: Number of audio block slots in the ring.
+    :return: (header, slots) arrays viewing the shared memory.
+    """
+    header = np.ndarray((2,), dtype=np.uint64, buffer=shm.buf)
+    slots = np.ndarray(
+        (n_slots, AUDIO_CHUNK_BYTES),
+        dtype=np.uint8,
+        buffer=shm.buf,
+        offset=_HEADER_BYTES,
+    )
+    return header, slots
+
+
+def _forward_results(results: "deque[STTResult]", messages: mp.Queue) -> None:
+    """
+    Send the child engine's pending results to the parent process.
+    """
+    while results:
+        result = results.popleft()
+        messages.put(
+            (
+                "result",
+                result.type,
+                result.text,
+                result.start_time,
+                result.end_time,
+            )
+        )
+        result.release()
+
+
+def _process_main(
+    model_path: str,
+    shm_name: str,
+    n_slots: int,
+    data_ready: mp.Event,
+    flush: mp.Event,
+    shutdown: mp.Event,
+    messages: mp.Queue,
+) -> None:
+    """
+    Entry point of the recognizer process.
+
+    Loads the model, reports ("ready",) or ("error", message), then feeds
+    every block the parent writes into the ring to a direct-mode engine
+    until `shutdown` is set, or until the parent turns out to have died
+    without setting it. A set `flush` event ends the current utterance
+    (like VoskEngine.stop) and is acknowledged with ("stopped",).
+    """
+    parent = mp.parent_process()
+    shm = _attach_shared_memory(shm_name)
+    header, slots = _ring_arrays(shm, n_slots)
+    views = [memoryview(row) for row in slots]
+    results: "deque[STTResult]" = deque()
+
+    try:
+        engine = VoskEngine(
+            Path(model_path),
+            audio_queue=None,
+            result_queue=results,
+            on_error=lambda exc: messages.put(("error", str(exc))),
+        )
+    except Exception as exc:  # noqa: BLE001
+        messages.put(("error", str(exc)))
+    else:
+        messages.put(("ready",))
+        running = False
+        consumed = 0
+        orphaned = False
+
+        while True:
+            # Same wakeup pattern as the engine thread: clear after the
+            # wait, then consume everything written so far. The timeout
+            # only serves to notice a parent that died without shutdown.
+            if not data_ready.wait(timeout=_LIVENESS_CHECK_INTERVAL_SEC):
+                if parent is not None and not parent.is_alive():
+                    orphaned = True
+                    break
+                continue
+            data_ready.clear()
+
+            written = int(header[_WRITTEN])
+            while consumed < written:
+                if not running:
+                    engine.start()
+                    running = True
+                engine.feed(views[consumed % n_slots])
+                consumed += 1
+                header[_CONSUMED] = consumed
+                _forward_results(results, messages)
+
+            if flush.is_set():
+                flush.clear()
+                if running:
+                    engine.stop()
+                    running = False
+                _forward_results(results, messages)
+                messages.put(("stopped",))
+
+            if shutdown.is_set():
+                break
+
+        if orphaned:
+            # Nobody is reading: do not block exit on flushing the queue.
+            messages.cancel_join_thread()
+            del views, header, slots
+            shm.close()
+            return
+
+        if running:
+            engine.stop()
+            _forward_results(results, messages)
+
+    # Views into the shared memory must be gone before it can be closed.
+    del views, header, slots
+    shm.close()
+    messages.put(("closed",))
+
+
+class VoskEngineProcess:
+    """
+    Drop-in alternative to `VoskEngine` that recognizes in a child process.
+
+    The model is loaded (in the child) by the constructor, which raises
+    RuntimeError if that fails. start()/stop() can be repeated; close()
+    ends the child process and frees the shared memory.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        audio_queue: "deque[memoryview]",
+        result_queue: "deque[STTResult]",
+        audio_ready: Optional[threading.Event] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        ring_slots: int = AUDIO_QUEUE_MAXLEN,
+    ) -> None:
+        """
+        :param model_path: Directory of the Vosk model.
+        :param audio_queue: Deque of raw audio blocks (AUDIO_CHUNK_BYTES
+                            each), as filled by AudioStream.
+        :param result_queue: Deque receiving STTResult objects.
+        :param audio_ready: Event set by the producer after each append.
+        :param on_error: Callback for non-fatal errors (called off the GUI
+                         thread).
+        :param ring_slots: Number of audio blocks the shared ring can hold.
+        """
+        self._audio_queue = audio_queue
+        self._result_queue = result_queue
+        self._audio_ready = audio_ready or threading.Event()
+        self._on_error = on_error
+        self._n_slots = ring_slots
+
+        # Number of audio blocks discarded because the ring was full, and
+        # of results discarded because result_queue was full.
+        self.dropped_blocks = 0
+        self.dropped_results = 0
+        self._dropping_results = False
+
+        self._shm = SharedMemory(
+            create=True, size=_HEADER_BYTES + ring_slots * AUDIO_CHUNK_BYTES
+        )
+        self._header, self._slots = _ring_arrays(self._shm, ring_slots)
+        self._header[:] = 0
+
+        # "spawn" rather than "fork": forking a process that runs Tk and
+        # other threads is unsafe.
+        ctx = mp.get_context("spawn")
+        self._data_ready = ctx.Event()
+        self._flush = ctx.Event()
+        self._shutdown = ctx.Event()
+        self._messages = ctx.Queue()
+
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._load_error: Optional[str] = None
+
+        self._pump_stop = threading.Event()
+        self._pump_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._process = ctx.Process(
+            target=_process_main,
+            args=(
+                str(model_path),
+                self._shm.name,
+                ring_slots,
+                self._data_ready,
+                self._flush,
+                self._shutdown,
+                self._messages,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+
+        self._reader_thread = threading.Thread(
+            target=self._read_messages, daemon=True
+        )
+        self._reader_thread.start()
+
+        # Block until the child has loaded the model, like VoskEngine does.
+        while not self._ready.wait(timeout=0.5):
+            if not self._process.is_alive():
+                self._load_error = (
+                    "Recognizer process exited with code "
+                    f"{self._process.exitcode}"
+                )
+                break
+        if self._load_error is not None:
+            self.close()
+            raise RuntimeError(self._load_error)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._pump_thread is not None:
+            return
+        self._pump_stop.clear()
+        self._pump_thread = threading.Thread(target=self._pump, daemon=True)
+        self._pump_thread.start()
+
+    def stop(self) -> None:
+        if self._pump_thread is None:
+            return
+
+        # Stop pumping first, so every block already handed over is
+        # recognized before the final result is flushed.
+        self._pump_stop.set()
+        self._audio_ready.set()
+        self._pump_thread.join(timeout=1.0)
+        self._pump_thread = None
+
+        self._stopped.clear()
+        self._flush.set()
+        self._data_ready.set()
+
+        # Give up early if the child has died and will never acknowledge.
+        deadline = time.monotonic() + _STOP_TIMEOUT_SEC
+        while not self._stopped.wait(timeout=0.1):
+            if not self._process.is_alive() or time.monotonic() >= deadline:
+                break
+
+    def close(self) -> None:
+        """
+        Stop, end the recognizer process and release the shared memory.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.stop()
+
+        self._shutdown.set()
+        self._data_ready.set()
+        self._process.join(timeout=_STOP_TIMEOUT_SEC)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        # The reader ends on the child's "closed", or on its own once the
+        # child has exited (e.g. crashed or was terminated) without one.
+        self._reader_thread.join(timeout=_LIVENESS_CHECK_INTERVAL_SEC + 1.0)
+
+        del self._header, self._slots
+        self._shm.close()
+        self._shm.unlink()
+
+    # ------------------------------------------------------------------
+    # Background threads
+    # ------------------------------------------------------------------
+    def _pump(self) -> None:
+        """
+        Copy audio blocks from audio_queue into the shared ring.
+        """
+        header = self._header
+        slots = self._slots
+        n_slots = self._n_slots
+        popleft = self._audio_queue.popleft
+        # True while consecutive blocks are being dropped; each run of drops
+        # is reported once rather than once per block.
+        dropping = False
+
+        while not self._pump_stop.is_set():
+            try:
+                chunk = popleft()
+            except IndexError:
+                self._audio_ready.wait()
+                self._audio_ready.clear()
+                continue
+
+            written = int(header[_WRITTEN])
+            if written - int(header[_CONSUMED]) >= n_slots:
+                # The child is too far behind: drop this block.
+                self.dropped_blocks += 1
+                if not dropping and self._on_error is not None:
+                    self._on_error(
+                        OverflowError(
+                            "STT process ring full; dropping audio "
+                            f"({self.dropped_blocks} blocks dropped so far)"
+                        )
+                    )
+                dropping = True
+                continue
+            dropping = False
+
+            # Fill the slot before publishing the new count.
+            np.copyto(
+                slots[written % n_slots], np.frombuffer(chunk, dtype=np.uint8)
+            )
+            header[_WRITTEN] = written + 1
+            self._data_ready.set()
+
+    def _read_messages(self) -> None:
+        """
+        Dispatch messages from the recognizer process.
+
+        Returns on ("closed",), or once the process has exited and nothing
+        is left to read. A crashed child never sends "closed", and a
+        message posted on its behalf could block forever: a child killed
+        mid-send keeps the queue's write lock.
+        """
+        while True:
+            try:
+                message = self._messages.get(
+                    timeout=_LIVENESS_CHECK_INTERVAL_SEC
+                )
+            except queue.Empty:
+                if self._process.exitcode is None:
+                    continue
+                message = ("closed",)
+            kind = message[0]
+
+            if kind == "result":
+                self._emit(STTResult.acquire(*message[1:]))
+            elif kind == "ready":
+                self._ready.set()
+            elif kind == "stopped":
+                self._stopped.set()
+            elif kind == "error":
+                if not self._ready.is_set():
+                    # Model loading failed: report it to the constructor.
+                    self._load_error = message[1]
+                    self._ready.set()
+                elif self._on_error is not None:
+                    self._on_error(RuntimeError(message[1]))
+            elif kind == "closed":
+                # Unblock anyone still waiting on the child.
+                self._ready.set()
+                self._stopped.set()
+                return
+
+    def _emit(self, result: STTResult) -> None:
+        """
+        Append a result for the GUI, like `VoskEngine._emit`: a stale
+        partial at the tail is superseded, and drops from a full
+        result_queue are counted and reported once per run of drops.
+        """
+        if not _push_result(self._result_queue, result):
+            self._dropping_results = False
+            return
+
+        self.dropped_results += 1
+        if not self._dropping_results and self._on_error is not None:
+            self._on_error(
+                OverflowError(
+                    "STT result queue full; dropping oldest results "
+                    f"({self.dropped_results} dropped so far)"
+                )
+            )
+        self._dropping_results = True
@@ -7,7 +7,15 @@ as expected.
 
 from __future__ import annotations
 
-from stt_gui.stt.sentence_segmenter import SentenceSegmenter
+import numpy as np
+import pytest
+
+from stt_gui.stt import sentence_segmenter
+from stt_gui.stt.sentence_segmenter import (
+    SentenceSegmenter,
+    WordTiming,
+    WordTimings,
+)
 
 
 def test_sentence_segmenter_boundary() -> None:
@@ -21,3 +29,123 @@ def test_sentence_segmenter_boundary() -> None:
 
     # Gap larger than threshold -> boundary.
     assert segmenter.is_boundary(prev_end=1.0, next_start=2.5)
+
+    # The bound predicate gives the same answers.
+    is_boundary = segmenter.make_predicate()
+    assert not is_boundary(1.0, 1.5)
+    assert is_boundary(1.0, 2.5)
+
+
+def test_sentence_segmenter_boundaries_mask() -> None:
+    """
+    Verify that the vectorized boundaries mask matches is_boundary.
+    """
+    segmenter = SentenceSegmenter(pause_threshold_sec=1.0)
+
+    starts = np.array([0.0, 0.6, 2.5, 2.9, 3.9])
+    ends = np.array([0.5, 1.0, 2.8, 2.9, 4.2])
+
+    mask = segmenter.boundaries(ends, starts)
+
+    expected = [
+        segmenter.is_boundary(prev_end=ends[i], next_start=starts[i + 1])
+        for i in range(len(starts) - 1)
+    ]
+    assert mask.tolist() == expected == [False, True, False, True]
+
+    # A single word has no gaps, hence no boundaries.
+    assert segmenter.boundaries(ends[:1], starts[:1]).size == 0
+
+    # split_indices gives the index of the first word of each new sentence.
+    assert segmenter.split_indices(ends, starts).tolist() == [2, 4]
+    assert segmenter.split_indices(ends[:1], starts[:1]).size == 0
+
+
+def test_word_timings_from_vosk() -> None:
+    """
+    Verify that WordTimings stores Vosk words column-wise.
+    """
+    timings = WordTimings.from_vosk(
+        [
+            {"word": "hello", "start": 0.0, "end": 0.4, "conf": 1.0},
+            {"word": "world", "start": 0.5, "end": 0.9, "conf": 1.0},
+        ]
+    )
+
+    assert len(timings) == 2
+    assert timings.words == ["hello", "world"]
+    assert timings.starts.tolist() == [0.0, 0.5]
+    assert timings.ends.tolist() == [0.4, 0.9]
+    assert timings[1] == WordTiming(word="world", start=0.5, end=0.9)
+
+    # Missing timings are an error, not silently 0.0.
+    with pytest.raises(KeyError):
+        WordTimings.from_vosk([{"word": "hello", "end": 0.4}])
+
+
+def test_word_timings_split() -> None:
+    """
+    Verify that WordTimings.split cuts words and times at the given indices.
+    """
+    timings = WordTimings(
+        words=["a", "b", "c", "d"],
+        starts=np.array([0.0, 0.5, 2.0, 2.5]),
+        ends=np.array([0.4, 0.9, 2.4, 2.9]),
+    )
+
+    pieces = timings.split([2, 3])
+
+    assert [piece.words for piece in pieces] == [["a", "b"], ["c"], ["d"]]
+    assert [piece.starts.tolist() for piece in pieces] == [
+        [0.0, 0.5],
+        [2.0],
+        [2.5],
+    ]
+    assert pieces[0].ends.tolist() == [0.4, 0.9]
+
+    # No split points -> a single piece with everything.
+    assert [piece.words for piece in timings.split([])] == [timings.words]
+
+
+def random_word_times(rng: np.random.Generator, n_words: int):
+    """
+    Start/end times of n_words consecutive words with random gaps.
+    """
+    durations = rng.uniform(0.1, 0.6, n_words)
+    gaps = rng.choice([0.05, 0.3, 0.99, 1.0, 1.5, 3.0], n_words)
+    starts = np.cumsum(gaps + np.concatenate(([0.0], durations[:-1])))
+    return starts, starts + durations
+
+
+def test_scan_boundaries_loop_matches_numpy() -> None:
+    """
+    The scalar scan (the body numba compiles) agrees with the NumPy scan.
+    """
+    rng = np.random.default_rng(0)
+    for n_words in (0, 1, 2, 3, 17, 200):
+        starts, ends = random_word_times(rng, n_words)
+        loop = sentence_segmenter._scan_boundaries_loop(starts, ends, 1.0)
+        expected = sentence_segmenter._scan_boundaries_numpy(starts, ends, 1.0)
+
+        assert loop.dtype == expected.dtype == np.int32
+        assert loop.flags.c_contiguous
+        assert loop.tolist() == expected.tolist()
+
+
+def test_scan_boundaries_jit_matches_numpy() -> None:
+    """
+    The numba-compiled scan agrees with the NumPy scan.
+    """
+    pytest.importorskip("numba")
+    scan = sentence_segmenter._scan_boundaries
+    assert scan.py_func is sentence_segmenter._scan_boundaries_loop
+
+    rng = np.random.default_rng(1)
+    for n_words in (0, 1, 2, 17, 200):
+        starts, ends = random_word_times(rng, n_words)
+        result = scan(starts, ends, 1.0)
+        expected = sentence_segmenter._scan_boundaries_numpy(starts, ends, 1.0)
+
+        assert result.dtype == np.int32
+        assert result.flags.c_contiguous
+        assert result.tolist() == expected.tolist()
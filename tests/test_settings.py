@@ -0,0 +1,53 @@
+"""
+Unit tests for the helpers in `stt_gui.config.settings`.
+
+These only touch the filesystem (via pytest's `tmp_path`), so they run
+without audio devices or Vosk models installed.
+"""
+
+from __future__ import annotations
+
+from stt_gui.config.settings import list_available_vosk_models
+
+
+def test_list_available_vosk_models_requires_marker_file(tmp_path) -> None:
+    """
+    Only subdirectories containing a Vosk marker file are reported as models.
+    """
+    model_dir = tmp_path / "vosk-model-small-en-us-0.15"
+    (model_dir / "am").mkdir(parents=True)
+    (model_dir / "am" / "final.mdl").write_bytes(b"")
+
+    conf_model_dir = tmp_path / "vosk-model-it-0.22"
+    (conf_model_dir / "conf").mkdir(parents=True)
+    (conf_model_dir / "conf" / "model.conf").write_text("")
+
+    other_dir = tmp_path / "notes"
+    other_dir.mkdir()
+    (other_dir / "README").write_text("not a model")
+
+    (tmp_path / "empty-dir").mkdir()
+    (tmp_path / "not-a-model.txt").write_text("hello")
+
+    models = list_available_vosk_models(tmp_path)
+    assert sorted(models) == sorted([model_dir, conf_model_dir])
+
+
+def test_list_available_vosk_models_missing_dir(tmp_path) -> None:
+    """
+    A non-existent models directory yields an empty list.
+    """
+    assert list_available_vosk_models(tmp_path / "missing") == []
+
+
+def test_list_available_vosk_models_refresh(tmp_path) -> None:
+    """
+    refresh=True picks up a marker added inside an existing subdirectory,
+    which does not change the models directory's own mtime.
+    """
+    model_dir = tmp_path / "vosk-model-small-en-us-0.15"
+    (model_dir / "am").mkdir(parents=True)
+    assert list_available_vosk_models(tmp_path) == []
+
+    (model_dir / "am" / "final.mdl").write_bytes(b"")
+    assert list_available_vosk_models(tmp_path, refresh=True) == [model_dir]
@@ -0,0 +1,368 @@
+"""
+Unit tests for VoskEngine's result handling.
+
+A scripted fake recognizer stands in for KaldiRecognizer, so no Vosk
+model is needed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+import pytest
+
+from stt_gui.config.settings import AUDIO_CHUNK_BYTES, STT_MAX_BATCH_BYTES
+from stt_gui.stt.sentence_segmenter import SentenceSegmenter
+from stt_gui.stt import vosk_engine
+from stt_gui.stt.vosk_engine import STTResult, VoskEngine
+
+
+class FakeRecognizer:
+    """
+    Replays a script of ("final" | "partial", raw JSON) steps, one per
+    AcceptWaveform call, and records the audio it was fed.
+    """
+
+    def __init__(self, script: List[tuple]) -> None:
+        self._script = deque(script)
+        self._raw = ""
+        self.fed: List[int] = []
+        self.data = b""
+
+    def AcceptWaveform(self, data: bytes) -> bool:
+        self.fed.append(len(data))
+        self.data += data
+        kind, self._raw = self._script.popleft()
+        return kind == "final"
+
+    def Result(self) -> str:
+        return self._raw
+
+    def PartialResult(self) -> str:
+        return self._raw
+
+    def FinalResult(self) -> str:
+        return '{"text" : ""}'
+
+
+def make_engine(
+    recognizer: Optional[FakeRecognizer] = None,
+    result_queue: Optional[deque] = None,
+) -> VoskEngine:
+    """
+    Build a VoskEngine without loading a model.
+    """
+    engine = VoskEngine.__new__(VoskEngine)
+    engine._result_queue = result_queue if result_queue is not None else deque()
+    engine._on_error = None
+    engine.dropped_results = 0
+    engine._dropping_results = False
+    engine._last_partial_hash = None
+    engine._last_final_hash = None
+    engine._last_partial_text = ""
+    engine._segmenter = SentenceSegmenter(pause_threshold_sec=1.0)
+    engine._is_boundary = engine._segmenter.make_predicate()
+    engine._recognizer = recognizer
+    engine._accept_waveform = (
+        vosk_engine._waveform_feeder(recognizer)
+        if recognizer is not None
+        else None
+    )
+    return engine
+
+
+def partial(text: str) -> tuple:
+    return ("partial", json.dumps({"partial": text}))
+
+
+def final(text: str, words: Optional[list] = None) -> tuple:
+    raw = {"text": text}
+    if words is not None:
+        raw["result"] = words
+    return ("final", json.dumps(raw))
+
+
+def drain(engine: VoskEngine) -> List[tuple]:
+    results = []
+    while engine._result_queue:
+        result: STTResult = engine._result_queue.popleft()
+        results.append(
+            (result.type, result.text, result.start_time, result.end_time)
+        )
+    return results
+
+
+def test_repeated_empty_final_resets_partial_state() -> None:
+    """
+    A partial repeating the previous utterance's text is emitted again
+    after a final, even if that final is a repeated (skipped) empty one.
+    """
+    recognizer = FakeRecognizer(
+        [final(""), partial("the"), final(""), partial("the")]
+    )
+    engine = make_engine(recognizer)
+
+    emitted = []
+    for _ in range(4):
+        engine._process_chunk(b"\0\0")
+        emitted.extend(drain(engine))
+
+    assert emitted == [("partial", "the", None, None)] * 2
+
+
+def test_partial_with_escaped_quote_falls_back_to_json() -> None:
+    """
+    Partials the regex fast path cannot read (escaped characters) are
+    still decoded correctly by the full JSON parse.
+    """
+    recognizer = FakeRecognizer([partial('say "hi"'), partial("say hi")])
+    engine = make_engine(recognizer)
+
+    engine._process_chunk(b"\0\0")
+    assert drain(engine) == [("partial", 'say "hi"', None, None)]
+
+    engine._process_chunk(b"\0\0")
+    assert drain(engine) == [("partial", "say hi", None, None)]
+
+
+def word(text: str, start: float, end: float) -> dict:
+    return {"conf": 1.0, "word": text, "start": start, "end": end}
+
+
+def test_final_timings_for_short_results() -> None:
+    """
+    One-word finals take their timing from that word; finals without a
+    word list have no timing; empty finals are not emitted.
+    """
+    recognizer = FakeRecognizer(
+        [
+            final("hello", [word("hello", 0.5, 0.9)]),
+            final("hi"),
+            final("", []),
+        ]
+    )
+    engine = make_engine(recognizer)
+
+    for _ in range(3):
+        engine._process_chunk(b"\0\0")
+
+    assert drain(engine) == [
+        ("final", "hello", 0.5, 0.9),
+        ("final", "hi", None, None),
+    ]
+
+
+def test_final_with_untimed_word_has_no_timing() -> None:
+    """
+    A word without "start"/"end" leaves the final untimed (never 0.0),
+    whether the final has one word or several.
+    """
+    recognizer = FakeRecognizer(
+        [
+            final("hello", [{"word": "hello"}]),
+            final("hello world", [word("hello", 0.5, 0.9), {"word": "world"}]),
+        ]
+    )
+    engine = make_engine(recognizer)
+
+    engine._process_chunk(b"\0\0")
+    engine._process_chunk(b"\0\0")
+
+    assert drain(engine) == [
+        ("final", "hello", None, None),
+        ("final", "hello world", None, None),
+    ]
+
+
+def test_final_split_into_sentences_at_pauses() -> None:
+    """
+    A final with a pause >= the threshold becomes one final per sentence.
+    """
+    words = [
+        word("one", 0.0, 0.5),
+        word("two", 0.6, 1.0),
+        word("three", 2.5, 3.0),
+        word("four", 3.1, 3.4),
+    ]
+    recognizer = FakeRecognizer(
+        [final("one two three four", words), final("one two", words[:2])]
+    )
+    engine = make_engine(recognizer)
+
+    engine._process_chunk(b"\0\0")
+    engine._process_chunk(b"\0\0")
+
+    assert drain(engine) == [
+        ("final", "one two", 0.0, 1.0),
+        ("final", "three four", 2.5, 3.4),
+        ("final", "one two", 0.0, 1.0),
+    ]
+
+
+def test_unconsumed_partials_are_coalesced() -> None:
+    """
+    A newer result replaces a partial still waiting in result_queue, but
+    never a final.
+    """
+    recognizer = FakeRecognizer(
+        [
+            partial("one"),
+            partial("one two"),
+            final("one two", [word("one", 0.0, 0.4), word("two", 0.5, 0.9)]),
+            partial("three"),
+        ]
+    )
+    engine = make_engine(recognizer)
+
+    engine._process_chunk(b"\0\0")
+    engine._process_chunk(b"\0\0")
+    assert [r.text for r in engine._result_queue] == ["one two"]
+
+    engine._process_chunk(b"\0\0")
+    engine._process_chunk(b"\0\0")
+    assert drain(engine) == [
+        ("final", "one two", 0.0, 0.9),
+        ("partial", "three", None, None),
+    ]
+
+
+def test_full_result_queue_reports_drops_once_per_run() -> None:
+    """
+    Appending to a full result_queue drops the oldest result; every drop is
+    counted, but a run of drops is reported once.
+    """
+    errors: List[Exception] = []
+    engine = make_engine(result_queue=deque(maxlen=1))
+    engine._on_error = errors.append
+
+    engine._emit_final("first", 0.0, 1.0)
+    engine._emit_final("second", 1.0, 2.0)
+    engine._emit_final("third", 2.0, 3.0)
+
+    assert drain(engine) == [("final", "third", 2.0, 3.0)]
+    assert engine.dropped_results == 2
+    assert len(errors) == 1 and isinstance(errors[0], OverflowError)
+
+    # Once the consumer catches up, the next run is reported again.
+    engine._emit_final("fourth", 3.0, 4.0)
+    engine._emit_final("fifth", 4.0, 5.0)
+    assert engine.dropped_results == 3
+    assert len(errors) == 2 and "3 dropped" in str(errors[1])
+
+
+def test_worker_batches_queued_blocks() -> None:
+    """
+    The worker feeds queued blocks to Vosk in batches of at most
+    STT_MAX_BATCH_BYTES (whole blocks, at least one), in order.
+    """
+    max_batch = max(1, STT_MAX_BATCH_BYTES // AUDIO_CHUNK_BYTES)
+    n_blocks = 2 * max_batch + 1
+
+    recognizer = FakeRecognizer([partial("")] * n_blocks)
+    engine = make_engine(recognizer)
+    engine._audio_queue = deque(
+        memoryview(bytes([i]) * AUDIO_CHUNK_BYTES) for i in range(n_blocks)
+    )
+    engine._audio_ready = threading.Event()
+    engine._stop_evt = threading.Event()
+
+    worker = threading.Thread(target=engine._run, daemon=True)
+    worker.start()
+    deadline = time.monotonic() + 5.0
+    while engine._audio_queue and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine._stop_evt.set()
+    engine._audio_ready.set()
+    worker.join(timeout=5.0)
+
+    assert recognizer.fed == [
+        max_batch * AUDIO_CHUNK_BYTES,
+        max_batch * AUDIO_CHUNK_BYTES,
+        AUDIO_CHUNK_BYTES,
+    ]
+    assert recognizer.data == bytes(
+        i for i in range(n_blocks) for _ in range(AUDIO_CHUNK_BYTES)
+    )
+
+
+def test_scalar_and_vectorized_sentence_splits_agree(monkeypatch) -> None:
+    """
+    Short segments (Python loop with the bound predicate) and long ones
+    (vectorized scan) are split into the same sentences.
+    """
+    # Words 0.5 s apart, with a 2 s pause before every tenth word.
+    words = []
+    start = 0.0
+    for i in range(25):
+        start += 2.5 if i and i % 10 == 0 else 0.5
+        words.append(word(f"w{i}", start, start + 0.25))
+    text = " ".join(item["word"] for item in words)
+
+    splits = []
+    for max_words in (len(words), 1):
+        monkeypatch.setattr(vosk_engine, "_SCALAR_SPLIT_MAX_WORDS", max_words)
+        engine = make_engine(FakeRecognizer([final(text, words)]))
+        engine._process_chunk(b"\0\0")
+        splits.append(drain(engine))
+
+    assert splits[0] == splits[1]
+    assert [item[1].split()[0] for item in splits[0]] == ["w0", "w10", "w20"]
+
+
+class HandleRecognizer(FakeRecognizer):
+    """
+    Fake recognizer that also has the cffi handle of a real one.
+    """
+
+    _handle = object()
+
+
+class FakeVoskC:
+    """
+    Stand-in for the binding's `_c` module that records zero-copy calls.
+    """
+
+    def __init__(self, result: int) -> None:
+        self.result = result
+        self.calls: List[tuple] = []
+
+    def vosk_recognizer_accept_waveform(self, handle, data, length) -> int:
+        audio = bytes(vosk_engine._vosk_ffi.buffer(data))
+        self.calls.append((handle, audio, length))
+        return self.result
+
+
+def test_waveform_feeder_passes_buffer_in_place(monkeypatch) -> None:
+    """
+    With the binding's internals available, audio goes to the C call
+    without AcceptWaveform, and a C error raises RuntimeError.
+    """
+    fake_c = FakeVoskC(result=1)
+    monkeypatch.setattr(vosk_engine, "_vosk_c", fake_c)
+    monkeypatch.setattr(vosk_engine, "_ZERO_COPY_FEED", True)
+    recognizer = HandleRecognizer([])
+
+    accept = vosk_engine._waveform_feeder(recognizer)
+    assert accept(memoryview(bytearray(b"\1\2\3\4"))) is True
+    assert fake_c.calls == [(HandleRecognizer._handle, b"\1\2\3\4", 4)]
+    assert recognizer.fed == []
+
+    fake_c.result = -1
+    with pytest.raises(RuntimeError):
+        accept(memoryview(b"\0\0"))
+
+
+def test_waveform_feeder_falls_back_to_accept_waveform(monkeypatch) -> None:
+    """
+    Without the binding's internals, audio is copied into AcceptWaveform.
+    """
+    monkeypatch.setattr(vosk_engine, "_ZERO_COPY_FEED", False)
+    recognizer = HandleRecognizer([("final", "{}")])
+
+    accept = vosk_engine._waveform_feeder(recognizer)
+    assert accept(memoryview(b"\1\2")) is True
+    assert recognizer.data == b"\1\2"
@@ -0,0 +1,130 @@
+"""
+Unit tests for VoskEngineProcess.
+
+These start real recognizer processes. No Vosk model is needed: the
+process entry point is swapped for one that installs a stub engine in the
+child before running the real loop, so audio still goes through the pump
+thread and the shared-memory ring.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pytest
+
+import stt_gui.stt.vosk_process as vosk_process
+from stt_gui.config.settings import AUDIO_CHUNK_BYTES
+from stt_gui.stt.vosk_engine import STTResult
+
+# Bound before any test patches it; in the child this is always the real one.
+_process_main = vosk_process._process_main
+
+
+class StubEngine:
+    """
+    Direct-mode engine stand-in: one partial per fed block, one final on
+    stop. A block starting with 255 makes the process crash.
+    """
+
+    def __init__(self, model_path, audio_queue, result_queue, on_error) -> None:
+        self._results = result_queue
+        self._fed = 0
+
+    def start(self) -> None:
+        pass
+
+    def feed(self, chunk: memoryview) -> None:
+        if chunk[0] == 255:
+            os._exit(3)
+        self._fed += 1
+        self._results.append(STTResult.acquire("partial", f"block {chunk[0]}"))
+
+    def stop(self) -> None:
+        self._results.append(
+            STTResult.acquire("final", f"{self._fed} blocks", 0.0, 1.0)
+        )
+
+
+def stub_process_main(*args) -> None:
+    """
+    Child entry point: run the real loop with StubEngine.
+    """
+    vosk_process.VoskEngine = StubEngine
+    _process_main(*args)
+
+
+def feed_blocks(engine, audio_queue, audio_ready, values) -> None:
+    for value in values:
+        audio_queue.append(
+            memoryview(np.full(AUDIO_CHUNK_BYTES, value, dtype=np.uint8))
+        )
+        audio_ready.set()
+        time.sleep(0.05)
+
+
+def test_process_start_stop_close(monkeypatch) -> None:
+    """
+    Blocks reach the child's engine through the ring, stop() flushes the
+    final result, and close() ends the child cleanly.
+    """
+    monkeypatch.setattr(vosk_process, "_process_main", stub_process_main)
+
+    audio_queue: deque = deque(maxlen=8)
+    result_queue: deque = deque()
+    audio_ready = threading.Event()
+    engine = vosk_process.VoskEngineProcess(
+        "stub-model", audio_queue, result_queue, audio_ready, ring_slots=4
+    )
+
+    engine.start()
+    feed_blocks(engine, audio_queue, audio_ready, (1, 2, 3))
+    engine.stop()
+    engine.close()
+
+    # Unconsumed partials are superseded, so only the last partial (if it
+    # arrived in time) can precede the final.
+    results = [(r.type, r.text) for r in result_queue]
+    assert results[-1] == ("final", "3 blocks")
+    assert all(kind == "partial" for kind, _ in results[:-1])
+    assert len(results) <= 2
+    assert engine.dropped_blocks == 0
+    assert engine._process.exitcode == 0
+    assert not engine._reader_thread.is_alive()
+
+
+def test_process_close_after_crash(monkeypatch) -> None:
+    """
+    stop() and close() return promptly if the child has died.
+    """
+    monkeypatch.setattr(vosk_process, "_process_main", stub_process_main)
+
+    audio_queue: deque = deque(maxlen=8)
+    audio_ready = threading.Event()
+    engine = vosk_process.VoskEngineProcess(
+        "stub-model", audio_queue, deque(), audio_ready, ring_slots=4
+    )
+
+    engine.start()
+    feed_blocks(engine, audio_queue, audio_ready, (255,))
+    engine._process.join(timeout=5.0)
+
+    started = time.monotonic()
+    engine.stop()
+    engine.close()
+
+    assert time.monotonic() - started < 2.0
+    assert engine._process.exitcode == 3
+    assert not engine._reader_thread.is_alive()
+
+
+def test_process_reports_model_load_error(tmp_path) -> None:
+    """
+    A model that fails to load in the child raises from the constructor.
+    """
+    with pytest.raises(RuntimeError):
+        vosk_process.VoskEngineProcess(tmp_path, deque(), deque())
@@ -0,0 +1,30 @@
+"""
+Unit tests for the display-independent helpers in `stt_gui.gui.widgets`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from stt_gui.gui.widgets import format_timestamp
+
+
+def test_format_timestamp_range() -> None:
+    """
+    Both ends are formatted as local HH:MM:SS.mmm, truncated to millis.
+    """
+    start = 1_700_000_000.1234
+    end = 1_700_000_002.9876
+
+    expected_start = datetime.fromtimestamp(1_700_000_000.123).strftime("%H:%M:%S.%f")[:-3]
+    expected_end = datetime.fromtimestamp(1_700_000_002.987).strftime("%H:%M:%S.%f")[:-3]
+
+    assert format_timestamp(start, end) == f"{expected_start}-{expected_end}"
+
+
+def test_format_timestamp_unknown() -> None:
+    """
+    Missing times produce the "unknown" placeholder.
+    """
+    assert format_timestamp(None, 1.0) == "unknown"
+    assert format_timestamp(1.0, None) == "unknown"